@@ -5,6 +5,7 @@ setup(
     version="0.1",
     packages=find_packages(where="src"),
     package_dir={"": "src"},
+    python_requires=">=3.10",
     install_requires=[
         "tcod>=11.15",
         "numpy>=1.24.0",
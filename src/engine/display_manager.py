@@ -1,9 +1,105 @@
 # src/engine/display_manager.py
 
 import tcod
-from typing import Dict, Optional
+from typing import Dict, Optional, Set, Tuple
 from .message_manager import MessageManager
+from src.utils.configuration_manager import ConfigurationManager
 
+# The tilesheet is laid out in CP437 order. load_tilesheet only reads the
+# charmap, so the shared tcod table is used as-is rather than copied.
+_CHARMAP = tcod.tileset.CHARMAP_CP437
+
+# (ch, fg, bg) of a cleared tile
+_BLANK_TILE = (ord(" "), (255, 255, 255), (0, 0, 0))
+
+
+class ConsoleView:
+	"""A rectangular region of a parent console, used as a console layer.
+
+	Reads and writes go straight into the parent's tile buffer, so layers
+	never need to be blitted onto the root console before presenting.
+	Supports the subset of the tcod Console API the UI uses; print,
+	draw_frame and draw_rect are clipped so they never spill into a
+	neighbouring layer.
+	"""
+
+	def __init__(self, parent: tcod.console.Console, x: int, y: int, width: int, height: int):
+		self.parent = parent
+		self.x = x
+		self.y = y
+		self.width = width
+		self.height = height
+
+	@property
+	def rgb(self):
+		"""Writable view of this region's (ch, fg, bg) tiles, indexed [y, x]."""
+		return self.parent.rgb[self.y:self.y + self.height, self.x:self.x + self.width]
+
+	# Alias kept for callers written against older tcod versions
+	tiles_rgb = rgb
+
+	@property
+	def ch(self):
+		return self.parent.ch[self.y:self.y + self.height, self.x:self.x + self.width]
+
+	@property
+	def fg(self):
+		return self.parent.fg[self.y:self.y + self.height, self.x:self.x + self.width]
+
+	@property
+	def bg(self):
+		return self.parent.bg[self.y:self.y + self.height, self.x:self.x + self.width]
+
+	def clear(self) -> None:
+		"""Reset every tile in the region with a single numpy fill."""
+		self.rgb[...] = _BLANK_TILE
+
+	def print(self, x: int, y: int, string: str,
+	          fg: Optional[Tuple[int, int, int]] = None,
+	          bg: Optional[Tuple[int, int, int]] = None,
+	          bg_blend: int = tcod.constants.BKGND_SET,
+	          alignment: int = tcod.constants.LEFT) -> None:
+		"""Print left-aligned text, clipped to the region."""
+		if alignment != tcod.constants.LEFT:
+			raise ValueError("ConsoleView.print only supports left-aligned text")
+		if not 0 <= y < self.height or x >= self.width:
+			return
+		if x < 0:
+			string, x = string[-x:], 0
+		self.parent.print(self.x + x, self.y + y, string[:self.width - x], fg, bg, bg_blend)
+
+	def _clip(self, x: int, y: int, width: int, height: int) -> Optional[Tuple[int, int, int, int]]:
+		"""The part of a rect that lies inside the region, or None."""
+		x0, y0 = max(x, 0), max(y, 0)
+		x1, y1 = min(x + width, self.width), min(y + height, self.height)
+		if x0 >= x1 or y0 >= y1:
+			return None
+		return x0, y0, x1, y1
+
+	def draw_frame(self, x: int, y: int, width: int, height: int, *args, **kwargs) -> None:
+		"""Draw a frame, clipped to the region."""
+		clipped = self._clip(x, y, width, height)
+		if clipped is None:
+			return
+		x0, y0, x1, y1 = clipped
+		if (x0, y0, x1, y1) == (x, y, x + width, y + height):
+			self.parent.draw_frame(self.x + x, self.y + y, width, height, *args, **kwargs)
+			return
+		# Draw the whole frame off-screen over the tiles it covers, then
+		# copy back only the visible part
+		scratch = tcod.console.Console(width, height, order="C")
+		visible = scratch.rgb[y0 - y:y1 - y, x0 - x:x1 - x]
+		visible[...] = self.rgb[y0:y1, x0:x1]
+		scratch.draw_frame(0, 0, width, height, *args, **kwargs)
+		self.rgb[y0:y1, x0:x1] = visible
+
+	def draw_rect(self, x: int, y: int, width: int, height: int, *args, **kwargs) -> None:
+		"""Fill a rect, clipped to the region."""
+		clipped = self._clip(x, y, width, height)
+		if clipped is None:
+			return
+		x0, y0, x1, y1 = clipped
+		self.parent.draw_rect(self.x + x0, self.y + y0, x1 - x0, y1 - y0, *args, **kwargs)
 
 class DisplayManager:
 	"""Manages the game's display windows and rendering."""
@@ -26,98 +122,155 @@ class DisplayManager:
 		if config_manager:
 			self.display_config = config_manager.get_display_config()
 		else:
-			# Fallback to default configuration
-			from src.utils.configuration_manager import ConfigurationManager
-			self.display_config = ConfigurationManager().get_display_config()
+			# Fallback to the shared configuration
+			self.display_config = ConfigurationManager.get_instance().get_display_config()
 		
-		# Modify the tileset loading section
-		charmap = tcod.tileset.CHARMAP_CP437.copy()
-
 		self.tileset = tcod.tileset.load_tilesheet(
 			self.display_config.font_path,
 			self.display_config.font_width,
 			self.display_config.font_height,
-			charmap
+			_CHARMAP
 		)
 		
 		# Create the main window
-		self.context = tcod.context.new(
+		self.vsync = self.display_config.vsync
+		self.context = self._create_context(self.vsync)
+		
+		# Create root console
+		self.root_console = tcod.console.Console(self.SCREEN_WIDTH, self.SCREEN_HEIGHT)
+
+		# Layout is fixed, so offsets are resolved once
+		self._status_y = self.SCREEN_HEIGHT - self.STATUS_HEIGHT
+		self._sidebar_x = self.SCREEN_WIDTH - self.SIDEBAR_WIDTH
+		self._msglog_h = self.SCREEN_HEIGHT - self.MINIMAP_HEIGHT - self.STATUS_HEIGHT
+
+		# Create console layers as views that tile the root console
+		self.consoles: Dict[str, ConsoleView] = {
+			"main": ConsoleView(self.root_console, 0, 0, self._sidebar_x, self._status_y),
+			"status": ConsoleView(self.root_console, 0, self._status_y, self.SCREEN_WIDTH, self.STATUS_HEIGHT),
+			"message_log": ConsoleView(self.root_console, self._sidebar_x, self.MINIMAP_HEIGHT, self.SIDEBAR_WIDTH, self._msglog_h),
+			"minimap": ConsoleView(self.root_console, self._sidebar_x, 0, self.SIDEBAR_WIDTH, self.MINIMAP_HEIGHT)
+		}
+
+		# Dirty tracking: consoles touched since the last render
+		self._dirty: Set[str] = set()
+		self.mark_all_dirty()
+
+	def _create_context(self, vsync: bool) -> tcod.context.Context:
+		"""Create the window context with the configured size and tileset."""
+		context = tcod.context.new(
 			columns=self.display_config.screen_width,
 			rows=self.display_config.screen_height,
 			title="Nihilis",
-			vsync=self.display_config.vsync,
+			vsync=vsync,
 			sdl_window_flags=tcod.context.SDL_WINDOW_RESIZABLE,
 			tileset=self.tileset
 		)
 
-			# Verify context initialization
-		if not self.context:
+		# Verify context initialization
+		if not context:
 			raise RuntimeError("Failed to initialize TCOD context")
-		
-		# Create console layers
-		self.consoles: Dict[str, tcod.console.Console] = {
-			"main": tcod.console.Console(self.SCREEN_WIDTH - self.SIDEBAR_WIDTH, self.SCREEN_HEIGHT - self.STATUS_HEIGHT),
-			"status": tcod.console.Console(self.SCREEN_WIDTH, self.STATUS_HEIGHT),
-			"message_log": tcod.console.Console(self.SIDEBAR_WIDTH, self.SCREEN_HEIGHT - self.MINIMAP_HEIGHT - self.STATUS_HEIGHT),
-			"minimap": tcod.console.Console(self.SIDEBAR_WIDTH, self.MINIMAP_HEIGHT)
-		}
-			
-			# Create root console
-		self.root_console = tcod.console.Console(self.SCREEN_WIDTH, self.SCREEN_HEIGHT)
+		return context
 
+	def set_vsync(self, enabled: bool) -> None:
+		"""Turn vsync on or off at runtime.
 
+		Uses the SDL renderer when tcod exposes one, otherwise recreates the
+		context. Consoles are independent of the context and are kept.
+		"""
+		if enabled == self.vsync:
+			return
 
-	def render(self) -> None:
+		renderer = getattr(self.context, "sdl_renderer", None)
+		if renderer is not None:
+			renderer.set_vsync(enabled)
+		else:
+			self.context.close()
+			self.context = self._create_context(enabled)
+			# The new window starts blank
+			self.mark_all_dirty()
+		self.vsync = enabled
 
-		"""Render all console layers to the screen."""
-		# Clear the root console
-		self.root_console.clear()
-    
-		# Blit all console layers to the root console using modern syntax
-		# Main game view
-		self.consoles["main"].blit(
-			dest=self.root_console,
-			dest_x=0,
-			dest_y=0
-		)
+	def reload_config(self, config_manager=None) -> None:
+		"""Re-read the display configuration and recreate the window context.
 
-		# Status bar at bottom
-		self.consoles["status"].blit(
-			dest=self.root_console,
-			dest_x=0,
-			dest_y=self.SCREEN_HEIGHT - self.STATUS_HEIGHT
-		)
-    
-		# Message log on right
-		self.consoles["message_log"].blit(
-			dest=self.root_console,
-			dest_x=self.SCREEN_WIDTH - self.SIDEBAR_WIDTH,
-			dest_y=self.MINIMAP_HEIGHT,
-			width=self.SIDEBAR_WIDTH,
-			height=self.SCREEN_HEIGHT - self.MINIMAP_HEIGHT - self.STATUS_HEIGHT
-		)
-    
-		# Minimap in top-right
-		self.consoles["minimap"].blit(
-			dest=self.root_console,
-			dest_x=self.SCREEN_WIDTH - self.SIDEBAR_WIDTH,
-			dest_y=0
-		)
-    
-		# Present the root console to the screen
+		The root console and its layers are kept, so reloading doesn't
+		reallocate any tile buffers.
+		"""
+		if config_manager is None:
+			config_manager = ConfigurationManager.get_instance()
+		old_config = self.display_config
+		self.display_config = config_manager.get_display_config()
+
+		font_fields = ("font_path", "font_width", "font_height")
+		if any(getattr(old_config, f) != getattr(self.display_config, f) for f in font_fields):
+			self.tileset = tcod.tileset.load_tilesheet(
+				self.display_config.font_path,
+				self.display_config.font_width,
+				self.display_config.font_height,
+				_CHARMAP
+			)
+
+		self.context.close()
+		self.vsync = self.display_config.vsync
+		self.context = self._create_context(self.vsync)
+
+		# The new window starts blank, so everything must be presented
+		self.mark_all_dirty()
+
+	def mark_dirty(self, name: str) -> None:
+		"""Flag a console as changed since the last render."""
+		if name not in self.consoles:
+			return
+		self._dirty.add(name)
+
+	def print_at(self, name: str, x: int, y: int, string: str,
+	             fg: Optional[Tuple[int, int, int]] = None,
+	             bg: Optional[Tuple[int, int, int]] = None) -> None:
+		"""Print to a named console and mark it dirty."""
+		console = self.consoles.get(name)
+		if console is None:
+			return
+		console.print(x, y, string, fg=fg, bg=bg)
+		self.mark_dirty(name)
+
+	def mark_all_dirty(self) -> None:
+		"""Flag every console as changed, e.g. after the window was exposed or resized."""
+		for name in self.consoles:
+			self.mark_dirty(name)
+
+	def render(self) -> None:
+		"""Present the console layers to the screen.
+
+		The layers are views into the root console, so there is nothing to
+		composite; the root console is presented as-is. Nothing is presented
+		when no console changed since the last render.
+		"""
+		if not self._dirty:
+			return
+		self._dirty.clear()
 		self.context.present(self.root_console)
     
 	def clear_all(self) -> None:
-		"""Clear all console layers."""
-		for console in self.consoles.values():
-			console.clear()
-		self.root_console.clear()
+		"""Clear all console layers.
+
+		The layers tile the root console, so one contiguous fill clears them all.
+		"""
+		self.root_console.rgb[...] = _BLANK_TILE
+		self.mark_all_dirty()
     
-	def get_console(self, name: str) -> Optional[tcod.console.Console]:
+	def get_console(self, name: str) -> Optional[ConsoleView]:
 		"""Get a specific console layer by name."""
 		return self.consoles.get(name)
     
 	def close(self) -> None:
 		"""Clean up and close the display."""
 		self.context.close()
+    
+	def __enter__(self) -> "DisplayManager":
+		return self
+    
+	def __exit__(self, *exc_info) -> None:
+		"""Close the display however the block exits; exceptions propagate."""
+		self.close()
 
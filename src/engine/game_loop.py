@@ -1,4 +1,6 @@
 from typing import Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import chain
 import tcod
 from src.engine.display_manager import DisplayManager
 from src.engine.input_handler import InputHandler, GameState
@@ -12,7 +14,39 @@ from src.world.world_generator import WorldGenerator
 from src.utils.configuration_manager import ConfigurationManager
 from src.entities.player import Player
 
+# Events that carry pixel coordinates needing tile conversion
+_MOUSE_TYPES = frozenset({tcod.event.MouseMotion, tcod.event.MouseButtonDown})
+
+# Window events after which the whole screen must be presented again
+_WINDOW_TYPES = frozenset({tcod.event.WindowEvent, tcod.event.WindowResized})
+
+# Frames the pacer may fall behind before it resyncs to the current time
+_MAX_FRAME_LAG = 5
+
+# Compass names keyed by the sign of (dx, dy)
+_DIRECTIONS = {
+    (0, -1): "north", (0, 1): "south", (-1, 0): "west", (1, 0): "east",
+    (-1, -1): "northwest", (1, -1): "northeast",
+    (-1, 1): "southwest", (1, 1): "southeast",
+    (0, 0): ""
+}
+# Prebuilt walking and sprinting messages so moves skip string formatting
+_MOVE_MESSAGES = {delta: f"Moving {name}..." for delta, name in _DIRECTIONS.items()}
+_SPRINT_MESSAGES = {delta: f"Moving sprinting {name}..." for delta, name in _DIRECTIONS.items()}
+
+
+def _sign(value: int) -> int:
+    return 0 if value == 0 else (1 if value > 0 else -1)
+
 class GameLoop:
+    __slots__ = (
+        "display_manager", "input_handler", "state_manager", "message_manager",
+        "ui_manager", "performance_monitor", "world_generator", "player",
+        "target_fps", "frame_time", "max_frame_staleness", "world_width", "world_height",
+        "_frame_ns", "_frame_dirty", "_last_render_ns", "_dispatch",
+        "_world_executor", "_world_future",
+    )
+
     def __init__(
         self,
         display_manager: DisplayManager,
@@ -28,23 +62,52 @@ class GameLoop:
         self.message_manager = message_manager
         self.ui_manager = ui_manager
         self.performance_monitor = performance_monitor
-        self.target_fps = 60
+        
+        # Pace frames at the configured rate
+        config_manager = ConfigurationManager.get_instance()
+        self.target_fps = max(1, config_manager.get_performance_config().target_fps)
         self.frame_time = 1.0 / self.target_fps
+        self._frame_ns = 1_000_000_000 // self.target_fps
+        
+        # Only redraw when something changed, but never let the screen go
+        # staler than this many seconds so animations keep advancing
+        self._frame_dirty = True
+        self.max_frame_staleness = 0.5
+        self._last_render_ns = 0
+        
+        # Action handlers keyed by action type; each returns False to exit
+        self._dispatch = {
+            "quit": self._act_quit,
+            "start_game": self._act_start,
+            "open_inventory": self._act_inventory,
+            "open_character": self._act_character,
+            "move": self._handle_movement,
+            "mouse_move": self._handle_mouse_move
+        }
         
         # Initialize world generation
-        config_manager = ConfigurationManager()
         self.world_generator = WorldGenerator(config_manager)
         
-        # Generate initial world and create player
-        self._initialize_world()
-        self._initialize_player()
+        # Generate the initial world in the background so the main menu can
+        # render while it runs; the player is created once it's ready
+        self.player = None
+        self._world_executor = ThreadPoolExecutor(max_workers=1)
+        self._world_future: Optional[Future] = self._world_executor.submit(self.world_generator.generate)
         
         # Add debug print to confirm initialization
         # print("Game loop initialized with performance monitoring")
 
+    def _ensure_world(self):
+        """Swap in the background-generated world, waiting for it if needed."""
+        if self._world_future is not None:
+            self._initialize_world()
+            self._initialize_player()
+
     def _initialize_world(self):
-        """Generate the world and prepare it for rendering."""
-        world = self.world_generator.generate()
+        """Collect the generated world and prepare it for rendering."""
+        world = self._world_future.result()
+        self._world_future = None
+        self._world_executor.shutdown(wait=False)
         
         # Get world data for rendering using the proper method
         world_data = world.get_render_data()
@@ -62,39 +125,42 @@ class GameLoop:
         start_y = self.world_height // 2
         start_x = self.world_width // 2
         
-        self.player = Player(x=start_x, y=start_y)
+        self.player = Player(x=start_x, y=start_y,
+                             world_width=self.world_width, world_height=self.world_height)
         self.ui_manager.set_player(self.player)
 
     def handle_action(self, action) -> bool:
         """Handle a game action. Returns False if the game should exit."""
         if action is None:
             return True
-            
-        if action.action_type == "quit":
-            return False
-            
-        if action.action_type == "start_game":
-            self.message_manager.add_message("Welcome to Nihilis!", fg=(255, 223, 0))
-            return True
-            
-        if action.action_type == "open_inventory":
-            self.state_manager.change_state(GameState.INVENTORY)
-            self.message_manager.add_message("Opening inventory...", fg=(200, 200, 200))
-            return True
-            
-        if action.action_type == "open_character":
-            self.message_manager.add_message("Opening character screen...", fg=(200, 200, 200))
-            return True
-            
-        if action.action_type == "move":
-            self._handle_movement(action)
-        elif action.action_type == "mouse_move":
-            self._handle_mouse_move(action)
-            
+        
+        # Any action may have changed state or messages (the input handler
+        # also does so before returning some actions), so redraw next frame
+        self._frame_dirty = True
+        
+        handler = self._dispatch.get(action.action_type)
+        return handler(action) if handler else True
+    
+    def _act_quit(self, action) -> bool:
+        return False
+    
+    def _act_start(self, action) -> bool:
+        self.message_manager.add_message("Welcome to Nihilis!", fg=(255, 223, 0))
+        return True
+    
+    def _act_inventory(self, action) -> bool:
+        self.state_manager.change_state(GameState.INVENTORY)
+        self.message_manager.add_message("Opening inventory...", fg=(200, 200, 200))
+        return True
+    
+    def _act_character(self, action) -> bool:
+        self.message_manager.add_message("Opening character screen...", fg=(200, 200, 200))
         return True
         
-    def _handle_movement(self, action):
-        if self.state_manager.get_current_state() == GameState.GAME_WORLD:
+    def _handle_movement(self, action) -> bool:
+        # Moves made while the world is still generating are dropped; the
+        # main view shows a placeholder until it's swapped in
+        if self.player is not None and self.state_manager.get_current_state() == GameState.GAME_WORLD:
             dx, dy = action.params["dx"], action.params["dy"]
             
             # Update player position
@@ -105,66 +171,125 @@ class GameLoop:
             if 0 <= new_x < self.world_width and 0 <= new_y < self.world_height:
                 self.player.move(dx, dy)
                 
-                direction = self._get_movement_direction(dx, dy)
-                sprint = "sprinting " if action.params.get("sprint") else ""
-                self.message_manager.add_message(
-                    f"Moving {sprint}{direction}...",
-                    fg=(200, 200, 200)
-                )
+                messages = _SPRINT_MESSAGES if action.params.get("sprint") else _MOVE_MESSAGES
+                self.message_manager.add_message(messages[(_sign(dx), _sign(dy))], fg=(200, 200, 200))
+        return True
             
     def _get_movement_direction(self, dx: int, dy: int) -> str:
-        direction = ""
-        if dy < 0: direction = "north"
-        elif dy > 0: direction = "south"
-        if dx < 0: direction = f"{direction}west"
-        elif dx > 0: direction = f"{direction}east"
-        return direction
+        return _DIRECTIONS[(_sign(dx), _sign(dy))]
         
-    def _handle_mouse_move(self, action):
-        status_console = self.display_manager.get_console("status")
-        if status_console:
-            status_console.print(
-                30, 1,
-                f"Mouse: {action.params['x']}, {action.params['y']}", 
-                fg=(200, 200, 200)
-            )
+    def _handle_mouse_move(self, action) -> bool:
+        # The status bar redraws the readout only if the tile changed
+        self.ui_manager.set_mouse_tile((action.params['x'], action.params['y']))
+        return True
     
     def run(self):
-        """Main game loop."""
+        """Main game loop.
+
+        Input is handled as soon as it arrives: the loop blocks in
+        tcod.event.wait until the next frame is due, and any event wakes it
+        early. Rendering stays on the frame schedule, so input latency isn't
+        tied to the frame rate. Events are polled here rather than on a
+        separate thread because SDL requires the window's thread to pump them.
+        """
+        # Bind hot-path lookups once instead of per event. The context is
+        # still looked up per mouse event since set_vsync may replace it.
+        wait = tcod.event.wait
+        get = tcod.event.get
+        perf_counter_ns = time.perf_counter_ns
+        frame_ns = self._frame_ns
+        staleness_ns = int(self.max_frame_staleness * 1_000_000_000)
+        motion_type = tcod.event.MouseMotion
+        get_state = self.state_manager.get_current_state
+        process_event = self.input_handler.process_event
+        handle = self.handle_action
+        display_manager = self.display_manager
+        render_game_screen = self.ui_manager.render_game_screen
+        start_frame = self.performance_monitor.start_frame
+        end_frame = self.performance_monitor.end_frame
+        
         try:
-            next_frame_time = time.perf_counter()
+            # Frame deadlines are tracked in integer nanoseconds
+            next_frame_ns = perf_counter_ns()
             
             while True:
-                current_time = time.perf_counter()
+                # Block until input arrives or the next frame is due, rather
+                # than spinning on sleep + poll. Nothing animates on the main
+                # menu, so once it's drawn and the world is ready, block until
+                # input arrives and redraw on waking
+                if not self._frame_dirty and self._world_future is None and get_state() == GameState.MAIN_MENU:
+                    timeout = None
+                    self._frame_dirty = True
+                else:
+                    timeout = max(0, next_frame_ns - perf_counter_ns()) / 1_000_000_000
                 
-                # If it's not time for the next frame, sleep a bit
-                if current_time < next_frame_time:
-                    time.sleep(max(0, next_frame_time - current_time))
+                # Process all pending events, then drain anything queued while
+                # they were handled. Only the final pointer position matters
+                # for display, so motion events are coalesced
+                last_motion = None
+                events = chain(wait(timeout=timeout), get())
+                for event in events:
+                    # Exact type checks are a hash lookup rather than an MRO
+                    # walk; tcod's event classes aren't subclassed further
+                    event_type = type(event)
+                    if event_type is motion_type:
+                        last_motion = event
+                        continue
+                    if event_type in _MOUSE_TYPES:
+                        display_manager.context.convert_event(event)
+                    elif event_type in _WINDOW_TYPES:
+                        display_manager.mark_all_dirty()
+                        self._frame_dirty = True
+                    # Most events (key releases, text input, window events)
+                    # map to no action; don't pay for a handler call on them
+                    action = process_event(event)
+                    if action is not None and not handle(action):
+                        return
+                if last_motion is not None:
+                    display_manager.context.convert_event(last_motion)
+                    action = process_event(last_motion)
+                    if action is not None and not handle(action):
+                        return
+                
+                # Woken early by input; keep waiting until the frame is due
+                now_ns = perf_counter_ns()
+                if now_ns < next_frame_ns:
                     continue
                 
-                # Start frame timing
-                self.performance_monitor.start_frame()
+                # Swap in the world once generation finishes. Until then the
+                # loop keeps pumping events and the main view shows a
+                # placeholder, rather than blocking the window's thread
+                if self._world_future is not None and self._world_future.done():
+                    self._ensure_world()
+                    self._frame_dirty = True
                 
-                # Process all pending events
-                for event in tcod.event.get():
-                    if isinstance(event, (tcod.event.MouseMotion, tcod.event.MouseButtonDown)):
-                        self.display_manager.context.convert_event(event)
-                        action = self.input_handler.dispatch(event)
-                    else:
-                        action = self.input_handler.dispatch(event)
+                # Update game state and render, skipping frames where nothing changed
+                if self._frame_dirty or now_ns - self._last_render_ns >= staleness_ns:
+                    # Start frame timing
+                    start_frame()
                     
-                    if not self.handle_action(action):
-                        return
-                
-                # Update game state and render
-                self.ui_manager.render_game_screen()
+                    render_game_screen()
+                    self._frame_dirty = False
+                    self._last_render_ns = now_ns
+                    
+                    # End frame timing
+                    end_frame()
                 
-                # End frame timing
-                self.performance_monitor.end_frame()
+                # Advance the deadline by a fixed step rather than rebasing
+                # on now, so frames that overshoot don't lose time
+                next_frame_ns += frame_ns
                 
-                # Calculate next frame time
-                next_frame_time = current_time + self.frame_time
+                # If we've fallen several frames behind (e.g. a long stall),
+                # resync instead of rendering back-to-back to catch up
+                if now_ns - next_frame_ns > _MAX_FRAME_LAG * frame_ns:
+                    next_frame_ns = now_ns + frame_ns
                 
         except Exception as e:
-            logger.error(f"Error in game loop: {e}")
-            raise
\ No newline at end of file
+            logger.error("Error in game loop: %s", e)
+            raise
+        finally:
+            # Drop generation that hasn't started yet. A generate() already
+            # running can't be interrupted, and concurrent.futures joins its
+            # worker thread at interpreter exit, so quitting mid-generation
+            # waits for it to finish before the process ends
+            self._world_executor.shutdown(wait=False, cancel_futures=True)
\ No newline at end of file
@@ -1,35 +1,95 @@
 # src/engine/input_handler.py
 
-from enum import Enum, auto
-from typing import Optional, Dict, Any, Set, Tuple
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Mapping, NamedTuple, Tuple
 import tcod.event
 import tcod.context
-from dataclasses import dataclass
 from src.utils.logger_config import logger
 from src.engine.message_manager import MessageManager
-from src.engine.game_state_manager import GameStateManager
+# GameState is re-exported for callers that import it from here
+from src.engine.game_state_manager import GameStateManager, GameState
 
 
-class GameState(Enum):
-	"""Enum representing different game states that affect input handling."""
-	MAIN_MENU = auto()
-	GAME_WORLD = auto()
-	CHARACTER_SCREEN = auto()
-	INVENTORY = auto()
-	DIALOGUE = auto()
-	PAUSED = auto()
+def _noop(*args, **kwargs) -> None:
+	pass
 
-@dataclass
-class GameAction:
-	"""Represents an action triggered by input."""
+# tcod modifier masks, resolved once; left and right variants are included
+_KMOD_SHIFT = int(tcod.event.Modifier.SHIFT)
+_KMOD_CTRL = int(tcod.event.Modifier.CTRL)
+_KMOD_ALT = int(tcod.event.Modifier.ALT)
+
+# Modifier bits used in key table lookups
+_MOD_SHIFT = 1
+_MOD_CTRL = 2
+_MOD_ALT = 4
+_MOD_COMBOS = range(8)
+
+class GameAction(NamedTuple):
+	"""Represents an action triggered by input.
+
+	Actions are immutable, so the ones returned for key presses are built
+	once and shared rather than allocated per event.
+	"""
 	action_type: str
-	params: Dict[str, Any] = None
+	params: Mapping[str, Any] = MappingProxyType({})
+
+# Shared parameterless actions
+_QUIT = GameAction("quit")
+_START_GAME = GameAction("start_game")
+_ESCAPE = GameAction("escape")
+_OPEN_INVENTORY = GameAction("open_inventory")
+_CLOSE_INVENTORY = GameAction("close_inventory")
+_OPEN_CHARACTER = GameAction("open_character")
+_CLOSE_CHARACTER = GameAction("close_character")
+_SAVE_GAME = GameAction("save_game")
+_LOAD_GAME = GameAction("load_game")
+_END_DIALOGUE = GameAction("end_dialogue")
+_ADVANCE_DIALOGUE = GameAction("advance_dialogue")
+_UNPAUSE = GameAction("unpause")
+
+# Shared movement actions keyed by (dx, dy), walking and sprinting
+_DELTAS = [(dx, dy) for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dx or dy]
+_MOVE = {d: GameAction("move", MappingProxyType({"dx": d[0], "dy": d[1]})) for d in _DELTAS}
+_SPRINT = {d: GameAction("move", MappingProxyType({"dx": d[0], "dy": d[1], "sprint": True})) for d in _DELTAS}
 
-	def __post_init__(self):
-		if self.params is None:
-			self.params = {}
+# Config keybinding fields and what they're bound to
+_MOVEMENT_BINDINGS = {
+	'move_up': (0, -1),
+	'move_down': (0, 1),
+	'move_left': (-1, 0),
+	'move_right': (1, 0),
+	'move_up_left': (-1, -1),
+	'move_up_right': (1, -1),
+	'move_down_left': (-1, 1),
+	'move_down_right': (1, 1)
+}
+_COMMAND_BINDINGS = {
+	'inventory': _OPEN_INVENTORY,
+	'character': _OPEN_CHARACTER,
+	'quit': _ESCAPE,
+	'debug_overlay': GameAction("toggle_debug")
+}
 
-class InputHandler(tcod.event.EventDispatch[Optional[GameAction]]):
+# Key names as used in the config, aliases included, resolved once
+_KEYSYM_BY_NAME = dict(tcod.event.KeySym.__members__)
+
+@lru_cache(maxsize=1)
+def _build_keymaps(key_actions: Tuple[Tuple[str, str], ...]) -> Tuple[Mapping, Mapping]:
+	"""Resolve (key name, binding field) config pairs into movement and command maps.
+
+	Every InputHandler built from the same config shares the result.
+	"""
+	movement_keys = {}
+	command_keys = {}
+	for name, field in key_actions:
+		if field in _MOVEMENT_BINDINGS:
+			movement_keys[_KEYSYM_BY_NAME[name]] = _MOVE[_MOVEMENT_BINDINGS[field]]
+		elif field in _COMMAND_BINDINGS:
+			command_keys[_KEYSYM_BY_NAME[name]] = _COMMAND_BINDINGS[field]
+	return MappingProxyType(movement_keys), MappingProxyType(command_keys)
+
+class InputHandler:
 	"""Handles input events and converts them into game actions."""
 	
 	def __init__(self, context: tcod.context.Context,  # Change this type hint
@@ -37,137 +97,111 @@ class InputHandler(tcod.event.EventDispatch[Optional[GameAction]]):
 	             message_manager: Optional['MessageManager'] = None, 
 	             config_manager = None,
 	             debug: bool = False):
-		super().__init__()
 		self.context = context
 		self.state_manager = state_manager
 		self.message_manager = message_manager
 		self.debug = debug
+		if not debug:
+			self._debug_message = _noop
 
-		# Track currently pressed keys to handle multiple key inputs
-		self.pressed_keys: Set[int] = set()
-        
 		# Get keybindings from config manager if available
 		if config_manager:
-			key_config = config_manager.get_keybindings()
-			
-			# Initialize empty dictionaries
-			self.MOVEMENT_KEYS = {}
-			self.COMMAND_KEYS = {}
-			
-			# Handle movement keys
-			movement_mappings = {
-				'move_up': (0, -1),
-				'move_down': (0, 1),
-				'move_left': (-1, 0),
-				'move_right': (1, 0),
-				'move_up_left': (-1, -1),
-				'move_up_right': (1, -1),
-				'move_down_left': (-1, 1),
-				'move_down_right': (1, 1)
-			}
-			
-			# Process movement keys
-			for direction, (dx, dy) in movement_mappings.items():
-				keys = getattr(key_config, direction)
-				for key in keys:
-					keysym = getattr(tcod.event.KeySym, key)
-					self.MOVEMENT_KEYS[keysym] = GameAction("move", {"dx": dx, "dy": dy})
-			
-			# Process command keys
-			command_mappings = {
-				'inventory': 'open_inventory',
-				'character': 'open_character',
-				'quit': 'escape',
-				'debug_overlay': 'toggle_debug'
-			}
-			
-			for config_key, action_type in command_mappings.items():
-				if hasattr(key_config, config_key):
-					keys = getattr(key_config, config_key)
-					for key in keys:
-						keysym = getattr(tcod.event.KeySym, key)
-						self.COMMAND_KEYS[keysym] = GameAction(action_type)
+			key_map = config_manager.get_key_action_map()
+			self.MOVEMENT_KEYS, self.COMMAND_KEYS = _build_keymaps(tuple(key_map.items()))
 
 		else:
 			# Fallback to default keybindings
 			self.MOVEMENT_KEYS = {
 				# Cardinal directions
-				tcod.event.KeySym.UP: GameAction("move", {"dx": 0, "dy": -1}),
-				tcod.event.KeySym.DOWN: GameAction("move", {"dx": 0, "dy": 1}),
-				tcod.event.KeySym.LEFT: GameAction("move", {"dx": -1, "dy": 0}),
-				tcod.event.KeySym.RIGHT: GameAction("move", {"dx": 1, "dy": 0}),
+				tcod.event.KeySym.UP: _MOVE[(0, -1)],
+				tcod.event.KeySym.DOWN: _MOVE[(0, 1)],
+				tcod.event.KeySym.LEFT: _MOVE[(-1, 0)],
+				tcod.event.KeySym.RIGHT: _MOVE[(1, 0)],
 
 				# Vi keys - cardinal
-				tcod.event.KeySym.k: GameAction("move", {"dx": 0, "dy": -1}),
-				tcod.event.KeySym.j: GameAction("move", {"dx": 0, "dy": 1}),
-				tcod.event.KeySym.h: GameAction("move", {"dx": -1, "dy": 0}),
-				tcod.event.KeySym.l: GameAction("move", {"dx": 1, "dy": 0}),
+				tcod.event.KeySym.k: _MOVE[(0, -1)],
+				tcod.event.KeySym.j: _MOVE[(0, 1)],
+				tcod.event.KeySym.h: _MOVE[(-1, 0)],
+				tcod.event.KeySym.l: _MOVE[(1, 0)],
 				
 				# Vi keys - diagonal
-				tcod.event.KeySym.y: GameAction("move", {"dx": -1, "dy": -1}),
-				tcod.event.KeySym.u: GameAction("move", {"dx": 1, "dy": -1}),
-				tcod.event.KeySym.b: GameAction("move", {"dx": -1, "dy": 1}),
-				tcod.event.KeySym.n: GameAction("move", {"dx": 1, "dy": 1}),
+				tcod.event.KeySym.y: _MOVE[(-1, -1)],
+				tcod.event.KeySym.u: _MOVE[(1, -1)],
+				tcod.event.KeySym.b: _MOVE[(-1, 1)],
+				tcod.event.KeySym.n: _MOVE[(1, 1)],
 			}
 			
 			self.COMMAND_KEYS = {
-				tcod.event.KeySym.i: GameAction("open_inventory"),
-				tcod.event.KeySym.c: GameAction("open_character"),
-				tcod.event.KeySym.ESCAPE: GameAction("escape"),
+				tcod.event.KeySym.i: _OPEN_INVENTORY,
+				tcod.event.KeySym.c: _OPEN_CHARACTER,
+				tcod.event.KeySym.ESCAPE: _ESCAPE,
 			}
 
-	def dispatch(self, event: tcod.event.Event) -> Optional[GameAction]:
-		"""Override dispatch to include debug information."""
-		action = super().dispatch(event)
+		# Sprinting variant of each movement key
+		self.MOVEMENT_KEYS_SPRINT = {
+			key: _SPRINT[(action.params["dx"], action.params["dy"])]
+			for key, action in self.MOVEMENT_KEYS.items()
+		}
+
+		# Precomputed (state, key, mods) -> action table used by ev_keydown
+		self._key_table = self._build_key_table()
+
+		# Event handlers keyed by exact event class
+		self._event_handlers = {
+			tcod.event.Quit: self.ev_quit,
+			tcod.event.KeyDown: self.ev_keydown,
+			tcod.event.MouseMotion: self.ev_mousemotion,
+			tcod.event.MouseButtonDown: self.ev_mousebuttondown,
+		}
+
+	def process_event(self, event: tcod.event.Event) -> Optional[GameAction]:
+		"""Convert an event into a game action, or None if it's unhandled."""
+		handler = self._event_handlers.get(type(event))
+		if handler is None:
+			return None
+		action = handler(event)
 		if action and self.debug:
 			self._debug_message(f"Input: {event.__class__.__name__} -> Action: {action.action_type} - Params: {action.params}")
 		return action
 
+	# Name used by tcod's EventDispatch, which this class used to extend
+	dispatch = process_event
+
 	def ev_quit(self, event: tcod.event.Quit) -> Optional[GameAction]:
 		"""Handle window close button."""
-		return GameAction("quit")
+		return _QUIT
 
 	def ev_keydown(self, event: tcod.event.KeyDown) -> Optional[GameAction]:
 		"""Handle key press events based on current game state."""
 		if self.debug:
 			self._debug_message(f"Key pressed: {event.sym} (type: {type(event.sym)})")
 		
-		key = event.sym
-		self.pressed_keys.add(key)
+		# KeySym is an IntEnum with a Python-level __hash__; plain ints keep
+		# the table lookup on the C fast path
+		key = int(event.sym)
 
 		# Debug: Check if key is in movement keys
 		if self.debug:
-			self._debug_message(f"Movement keys: {self.MOVEMENT_KEYS}")
 			if key in self.MOVEMENT_KEYS:
 				self._debug_message(f"Movement key detected: {key} -> {self.MOVEMENT_KEYS[key]}")
 			else:
 				self._debug_message(f"Key {key} not found in movement keys")
 
-		# Handle modifier keys
+		# Fold left/right modifier variants into the key table's mod bits
 		mod = event.mod
-		shift = bool(mod & tcod.event.KMOD_SHIFT)
-		ctrl = bool(mod & tcod.event.KMOD_CTRL)
-		alt = bool(mod & tcod.event.KMOD_ALT)
-
-		# State-specific handling
-		if self.state_manager.get_current_state() == GameState.MAIN_MENU:
-			return self._handle_main_menu(key)
-		elif self.state_manager.get_current_state() == GameState.GAME_WORLD:
-			return self._handle_game_world(key, shift, ctrl, alt)
-		elif self.state_manager.get_current_state() == GameState.INVENTORY:
-			return self._handle_inventory(key)
-		elif self.state_manager.get_current_state() == GameState.CHARACTER_SCREEN:
-			return self._handle_character_screen(key)
-		elif self.state_manager.get_current_state() == GameState.DIALOGUE:
-			return self._handle_dialogue(key)
-		elif self.state_manager.get_current_state() == GameState.PAUSED:
-			return self._handle_paused(key)
-			
-		return None
+		mods = ((_MOD_SHIFT if mod & _KMOD_SHIFT else 0)
+		        | (_MOD_CTRL if mod & _KMOD_CTRL else 0)
+		        | (_MOD_ALT if mod & _KMOD_ALT else 0))
 
-	def ev_keyup(self, event: tcod.event.KeyUp) -> None:
-		"""Handle key release events."""
-		self.pressed_keys.discard(event.sym)
+		# One lookup resolves state-specific handling
+		entry = self._key_table.get((self.state_manager.get_current_state().value, key, mods))
+		if entry is None:
+			return None
+
+		action, transition = entry
+		if transition is not None:
+			self._apply_transition(*transition)
+		return action
 
 	def ev_mousemotion(self, event: tcod.event.MouseMotion) -> Optional[GameAction]:
 		"""Handle mouse movement."""
@@ -195,99 +229,74 @@ class InputHandler(tcod.event.EventDispatch[Optional[GameAction]]):
 			logger.warning("Mouse button event received without valid coordinates")
 			return None
 
-	def _handle_main_menu(self, key: int) -> Optional[GameAction]:
-		if key == tcod.event.KeySym.ESCAPE:
-			return GameAction("quit")
-		elif key == tcod.event.KeySym.RETURN:
-			self.state_manager.change_state(GameState.GAME_WORLD)
-			if self.message_manager:
-				self.message_manager.add_message("Welcome to the game world!", fg=(255, 255, 0))
-			return GameAction("start_game")
-		return None
-
-	def _handle_game_world(self, key: int, shift: bool, ctrl: bool, alt: bool) -> Optional[GameAction]:
-		"""Handle input specific to the game world state."""
-		if key == tcod.event.KeySym.ESCAPE:
-			self.state_manager.change_state(GameState.MAIN_MENU)
-			if self.message_manager:
-				self.message_manager.add_message("Returned to main menu", fg=(255, 255, 0))
-			return GameAction("escape")
-		elif key == tcod.event.KeySym.i:
-			self.state_manager.change_state(GameState.INVENTORY)
-			if self.message_manager:
-				self.message_manager.add_message("Opening inventory...", fg=(200, 200, 200))
-			return GameAction("open_inventory")
-		elif key == tcod.event.KeySym.c:
-			self.state_manager.change_state(GameState.CHARACTER_SCREEN)
-			if self.message_manager:
-				self.message_manager.add_message("Opening character screen...", fg=(200, 200, 200))
-			return GameAction("open_character")
-		# Check movement keys first
-		if key in self.MOVEMENT_KEYS:
-			if self.debug:
-				self._debug_message(f"Movement key detected: {key}")
-			action = self.MOVEMENT_KEYS[key]
-			if shift:
-				action.params["sprint"] = True
-			return action
-			
-		# Then check command keys
-		if key in self.COMMAND_KEYS:
-			return self.COMMAND_KEYS[key]
-			
-		# Handle combined key presses
-		if ctrl and key == tcod.event.KeySym.s:
-			return GameAction("save_game")
-		if ctrl and key == tcod.event.KeySym.l:
-			return GameAction("load_game")
-			
-		return None
-
-	def _handle_inventory(self, key: int) -> Optional[GameAction]:
-		"""Handle input specific to the inventory state."""
-		if key == tcod.event.KeySym.ESCAPE:
-			self.state_manager.change_state(GameState.GAME_WORLD)
-			if self.message_manager:
-				self.message_manager.add_message("Closed inventory screen...", fg=(200, 200, 200))
-			return GameAction("close_inventory")
-		elif key == tcod.event.KeySym.i:
-			self.state_manager.change_state(GameState.GAME_WORLD)
-			if self.message_manager:
-				self.message_manager.add_message("Closed inventory screen...", fg=(200, 200, 200))
-			return GameAction("close_inventory")
-		return None
-
-	def _handle_character_screen(self, key: int) -> Optional[GameAction]:
-		if key == tcod.event.KeySym.ESCAPE:
-			self.state_manager.change_state(GameState.GAME_WORLD)
-			if self.message_manager:
-				self.message_manager.add_message("Closed character screen...", fg=(200, 200, 200))
-			return GameAction("close_character")
-		elif key == tcod.event.KeySym.c:
-			self.state_manager.change_state(GameState.GAME_WORLD)
-			if self.message_manager:
-				self.message_manager.add_message("Closed character screen...", fg=(200, 200, 200))
-			return GameAction("close_character")
-		return None
-
-	def _handle_dialogue(self, key: int) -> Optional[GameAction]:
-		"""Handle input specific to dialogue state."""
-		if key == tcod.event.KeySym.ESCAPE:
-			return GameAction("end_dialogue")
-		elif key == tcod.event.KeySym.RETURN:
-			return GameAction("advance_dialogue")
-		return None
-
-	def _handle_paused(self, key: int) -> Optional[GameAction]:
-		"""Handle input specific to paused state."""
-		if key == tcod.event.KeySym.ESCAPE:
-			return GameAction("unpause")
-		elif key == tcod.event.KeySym.p:
-			return GameAction("unpause")
-		return None
+	def _build_key_table(self) -> Dict[Tuple[int, int, int], Tuple[GameAction, Optional[Tuple]]]:
+		"""Flatten the per-state key handling into a single lookup table.
+
+		Keys are (state value, keysym as int, mod bits). Each entry is an
+		(action, transition) pair, where transition is None or a
+		(new_state, message, fg) applied before the action is returned.
+		Later bindings take priority over earlier ones.
+		"""
+		table = {}
+
+		def bind(state, key, action, transition=None, mods=_MOD_COMBOS):
+			for m in mods:
+				table[(state.value, int(key), m)] = (action, transition)
+
+		KeySym = tcod.event.KeySym
+		shifted = [m for m in _MOD_COMBOS if m & _MOD_SHIFT]
+		unshifted = [m for m in _MOD_COMBOS if not m & _MOD_SHIFT]
+		with_ctrl = [m for m in _MOD_COMBOS if m & _MOD_CTRL]
+
+		# Main menu
+		bind(GameState.MAIN_MENU, KeySym.ESCAPE, _QUIT)
+		bind(GameState.MAIN_MENU, KeySym.RETURN, _START_GAME,
+		     (GameState.GAME_WORLD, "Welcome to the game world!", (255, 255, 0)))
+
+		# Game world, lowest priority first: combined key presses, then
+		# command keys, movement keys and finally the state-changing keys
+		bind(GameState.GAME_WORLD, KeySym.s, _SAVE_GAME, mods=with_ctrl)
+		bind(GameState.GAME_WORLD, KeySym.l, _LOAD_GAME, mods=with_ctrl)
+		for key, action in self.COMMAND_KEYS.items():
+			bind(GameState.GAME_WORLD, key, action)
+		for key, action in self.MOVEMENT_KEYS.items():
+			bind(GameState.GAME_WORLD, key, action, mods=unshifted)
+		for key, action in self.MOVEMENT_KEYS_SPRINT.items():
+			bind(GameState.GAME_WORLD, key, action, mods=shifted)
+		bind(GameState.GAME_WORLD, KeySym.ESCAPE, _ESCAPE,
+		     (GameState.MAIN_MENU, "Returned to main menu", (255, 255, 0)))
+		bind(GameState.GAME_WORLD, KeySym.i, _OPEN_INVENTORY,
+		     (GameState.INVENTORY, "Opening inventory...", (200, 200, 200)))
+		bind(GameState.GAME_WORLD, KeySym.c, _OPEN_CHARACTER,
+		     (GameState.CHARACTER_SCREEN, "Opening character screen...", (200, 200, 200)))
+
+		# Inventory and character screens
+		close_inventory = (GameState.GAME_WORLD, "Closed inventory screen...", (200, 200, 200))
+		for key in (KeySym.ESCAPE, KeySym.i):
+			bind(GameState.INVENTORY, key, _CLOSE_INVENTORY, close_inventory)
+		close_character = (GameState.GAME_WORLD, "Closed character screen...", (200, 200, 200))
+		for key in (KeySym.ESCAPE, KeySym.c):
+			bind(GameState.CHARACTER_SCREEN, key, _CLOSE_CHARACTER, close_character)
+
+		# Dialogue and pause
+		bind(GameState.DIALOGUE, KeySym.ESCAPE, _END_DIALOGUE)
+		bind(GameState.DIALOGUE, KeySym.RETURN, _ADVANCE_DIALOGUE)
+		for key in (KeySym.ESCAPE, KeySym.p):
+			bind(GameState.PAUSED, key, _UNPAUSE)
+
+		return table
+
+	def _apply_transition(self, state: GameState, message: str, fg: Tuple[int, int, int]) -> None:
+		"""Change state and report it in the message log."""
+		self.state_manager.change_state(state)
+		if self.message_manager:
+			self.message_manager.add_message(message, fg=fg)
 
 	def _debug_message(self, message: str) -> None:
-		"""Send debug messages to the message manager if debug mode is enabled."""
-		if self.debug and self.message_manager:
+		"""Send debug messages to the message manager.
+
+		Replaced with a no-op on instances created without debug.
+		"""
+		if self.message_manager:
 			self.message_manager.add_message(f"DEBUG: {message}", fg=(128, 128, 255))
 
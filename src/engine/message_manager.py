@@ -1,76 +1,109 @@
-from typing import List, Tuple
-import tcod
+from collections import deque
+from functools import lru_cache
+from itertools import islice
+from textwrap import wrap
+from typing import Deque, Iterable, List, Optional, Tuple
+import numpy as np
 
 class MessageManager:
+    __slots__ = ("_messages", "_encoded", "_pending", "max_messages", "console_width", "revision")
+
     def __init__(self, max_messages: int = 100, console_width: int = None):
-        self.messages: List[Tuple[str, Tuple[int, int, int]]] = []
+        # Bounded history; appending past max_messages drops the oldest line
+        self._messages: Deque[Tuple[str, Tuple[int, int, int]]] = deque(maxlen=max_messages)
+        # Code points of each history line, encoded once for rendering
+        self._encoded: Deque[np.ndarray] = deque(maxlen=max_messages)
+        # Messages added since the last flush, wrapped lazily as (text, fg, width)
+        self._pending: List[Tuple[str, Tuple[int, int, int], Optional[int]]] = []
         self.max_messages = max_messages
         self.console_width = console_width or 25  # Default if not specified
+        # Bumped on every add, so renderers can tell when the log changed
+        self.revision = 0
+
+    @property
+    def messages(self) -> Deque[Tuple[str, Tuple[int, int, int]]]:
+        """The wrapped message history, including any pending messages."""
+        if self._pending:
+            self._flush_pending()
+        return self._messages
 
-    def _wrap_text(self, text: str, width: int) -> List[str]:
-        """Break text into lines that fit within the given width."""
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _wrap_text(text: str, width: int) -> Tuple[str, ...]:
+        """Break text into lines that fit within the given width.
+
+        Results are cached, as the same messages tend to repeat.
+        """
         # Handle empty strings
         if not text:
-            return [""]
+            return ("",)
             
         # If text length is less than or equal to width, return as-is
         if len(text) <= width:
-            return [text]
+            return (text,)
             
-        # Split on newlines first to handle explicit line breaks
-        paragraphs = text.split('\n')
-        wrapped_lines = []
-        
-        for paragraph in paragraphs:
-            # Only proceed with wrapping if text is actually longer than width
-            words = paragraph.split()
-            current_line = []
-            current_length = 0
+        # Wrap each paragraph separately to keep explicit line breaks. Runs
+        # of whitespace collapse to one space, which textwrap wouldn't do
+        return tuple(
+            line
+            for paragraph in text.split('\n')
+            for line in wrap(" ".join(paragraph.split()), width, break_long_words=False, break_on_hyphens=False)
+        )
 
-            for word in words:
-                word_length = len(word)
-                space_length = 1 if current_line else 0
-                
-                if current_length + word_length + space_length <= width:
-                    current_line.append(word)
-                    current_length += word_length + space_length
-                else:
-                    if current_line:
-                        wrapped_lines.append(" ".join(current_line))
-                    current_line = [word]
-                    current_length = word_length
+    def add_message(self, text: str, fg: Tuple[int, int, int] = (255, 255, 255), width: int = None):
+        """Queue a message; it is wrapped to fit the console width when flushed."""
+        self._pending.append((text, fg, width))
+        self.revision += 1
 
-            if current_line:
-                wrapped_lines.append(" ".join(current_line))
+    def bulk_add(self, messages: Iterable[Tuple[str, Tuple[int, int, int]]]) -> None:
+        """Queue several (text, fg) messages as one change to the log."""
+        self._pending.extend((text, fg, None) for text, fg in messages)
+        self.revision += 1
 
-        return wrapped_lines
+    def _flush_pending(self) -> None:
+        """Wrap pending messages into the history."""
+        history = self._messages
+        encoded = self._encoded
+        for text, fg, width in self._pending:
+            # Use provided width if given, otherwise use console_width
+            available_width = width if width is not None else self.console_width
 
-    def add_message(self, text: str, fg: Tuple[int, int, int] = (255, 255, 255), width: int = None):
-        """Add a message, wrapping it if necessary to fit the console width."""
-        if not text:
-            self.messages.append(("", fg))
-            return
+            # Most messages fit on one line and skip wrapping entirely.
+            # Margins are applied only when wrapping is needed.
+            if not text or len(text) <= available_width:
+                lines = (text,)
+            else:
+                lines = self._wrap_text(text, available_width - 4)
 
-        # Use provided width if given, otherwise use console_width
-        available_width = width if width is not None else self.console_width
-        if len(text) > available_width:
-            available_width = available_width - 4  # Apply margins only when wrapping is needed
-        
-        wrapped_lines = self._wrap_text(text, available_width)
-        
-        for line in wrapped_lines:
-            self.messages.append((line, fg))
-            while len(self.messages) > self.max_messages:
-                self.messages.pop(0)
+            for line in lines:
+                history.append((line, fg))
+                encoded.append(np.frombuffer(line.encode("utf-32-le"), dtype=np.uint32))
+        self._pending.clear()
 
     def render_messages(self, console: 'Console') -> None:
-        """Render messages to the provided console."""
-        # Start from the bottom, accounting for bottom frame border
-        y = console.height - 2  # Changed from -1 to -2 to respect bottom border
+        """Render messages to the provided console.
+
+        Visible lines are laid out in a tile block from their pre-encoded
+        code points and written with one numpy assignment per channel.
+        """
+        # Lines run from the bottom up, between the frame borders, starting
+        # after a one-cell margin
+        width = console.width - 3
+        messages = self.messages
+        rows = min(len(messages), max(0, console.height - 3))
+        if not rows or width <= 0:
+            return
+        
+        block = np.full((rows, width), ord(" "), dtype=np.int32)
+        colors = np.empty((rows, 3), dtype=np.uint8)
+        newest = islice(zip(reversed(self._encoded), reversed(messages)), rows)
+        for i, (codes, (_, color)) in enumerate(newest):
+            codes = codes[:width]
+            block[i, :len(codes)] = codes
+            colors[i] = color
         
-        # Render messages until we hit the top frame border or run out of messages
-        for message, color in reversed(self.messages):
-            if y <= 1:  # Stop at top frame border
-                break
-            console.print(x=2, y=y, string=message, fg=color)
-            y -= 1
\ No newline at end of file
+        # Rows were collected newest first; flip them to read top-down
+        y1 = console.height - 1
+        y0 = y1 - rows
+        console.ch[y0:y1, 2:2 + width] = block[::-1]
+        console.fg[y0:y1, 2:2 + width] = colors[::-1, np.newaxis]
@@ -1,32 +1,192 @@
 # src/engine/ui_manager.py
-from typing import Dict, Optional, Tuple, Set
+from typing import Dict, Optional, Tuple
+import numpy as np
 import tcod
-import time
 
 from src.engine.display_manager import DisplayManager
-from src.engine.message_manager import MessageManager
-from src.utils.performance_monitor import PerformanceMonitor
+from src.utils.logger_config import logger
 from src.world.map_renderer import MapRenderer
 from src.world.biome_type import BiomeType
 
+TERRAIN_COLORS = {
+	'≈': (0, 148, 255),    # Deep water (blue)
+	'~': (65, 185, 255),   # Shallow water (light blue)
+	'.': (100, 220, 100),  # Plains (green)
+	chr(239): (160, 160, 160),  # Hills (gray)
+	'^': (128, 128, 128),  # Mountains (dark gray)
+	'▲': (200, 200, 200),  # Peaks (light gray)
+	'♠': (0, 180, 0),      # Forest (dark green)
+	'∙': (255, 255, 150),  # Desert (yellow)
+	',': (200, 200, 200),  # Tundra (white)
+	':': (255, 240, 150),  # Beach (sand)
+	'?': (100, 100, 100),  # Unknown (dark gray)
+	chr(0x263C): (255, 215, 0),    # Capital city (gold)
+	'*': (215, 175, 220),  # Major city (mustard)
+	chr(0x2219): (180, 180, 180),  # Minor city (darker gray)
+	chr(0x2302): (180, 180, 180),  # Village (darker gray)
+	chr(0x03C6): (180, 70, 70),  # Ruins (darker gray)
+	chr(0x03A9): (220, 70, 70),  # Dungeon (darker gray)
+	'+': (150, 15, 225),  # Temple (mustard)
+	'@': (255, 128, 255),  # Player character (lavender)
+	# Frame characters
+	'┌': (255, 255, 255),  # White
+	'┐': (255, 255, 255),
+	'└': (255, 255, 255),
+	'┘': (255, 255, 255),
+	'─': (255, 255, 255),
+	'│': (255, 255, 255),
+}
+
+# TERRAIN_COLORS as a table indexed by code point, white by default. The
+# last entry stays white so out-of-range code points can be clipped to it.
+_TERRAIN_COLOR_LUT = np.full((0x10000, 3), 255, dtype=np.uint8)
+for _char, _color in TERRAIN_COLORS.items():
+	_TERRAIN_COLOR_LUT[ord(_char)] = _color
+
+# Display names of biomes by ID
+_BIOME_NAMES = {biome.value: biome.name.replace('_', ' ').title() for biome in BiomeType}
+
+# Biome IDs whose forests and mountains are recolored
+_COLD_BIOMES = np.array([BiomeType.TUNDRA.value, BiomeType.COLD_DESERT.value], dtype=np.int8)
+_FOREST_BIOMES = np.array([BiomeType.TEMPERATE_FOREST.value, BiomeType.TEMPERATE_RAINFOREST.value, BiomeType.TROPICAL_RAINFOREST.value], dtype=np.int8)
+
+# Status bar column of the mouse position readout
+_MOUSE_STATUS_X = 30
+
 class UIManager:
 	"""Manages UI layout and rendering."""
 
+	__slots__ = (
+		"display_manager", "message_manager", "map_renderer", "world_data", "debug",
+		"performance_monitor", "player", "mouse_tile", "use_los", "visible_mask",
+		"_main_frame", "_status_frame", "_status_spans", "_message_log_frame", "_minimap_frame", "_panel_keys", "_los_key",
+		"_console_main", "_console_status", "_console_message_log", "_console_minimap",
+		"_settlement_by_pos", "_minimap_render_data",
+		"_main_ch", "_main_biome", "_main_fg", "_main_hidden",
+	)
+
 	def __init__(self, display_manager: DisplayManager, message_manager=None, debug=False):
 		self.display_manager = display_manager
 		self.message_manager = message_manager
 		self.map_renderer = MapRenderer()
 		self.world_data = None
+		# Settlements keyed by their (y, x) world position
+		self._settlement_by_pos: Dict[Tuple[int, int], object] = {}
+		self._minimap_render_data: Optional[Dict] = None
 		self.debug = debug
 		self.performance_monitor = None
 		self.player = None
+		# Console tile under the mouse, shown in the status bar
+		self.mouse_tile: Optional[Tuple[int, int]] = None
 		self.use_los = True  # Can be toggled
-		self.visible_positions: Set[Tuple[int, int]] = set()
+		# [y, x] mask of visible view positions and what it was computed for
+		self.visible_mask: Optional[np.ndarray] = None
+		self._los_key = None
+		# Main view tile buffers, reused across frames while the view size holds
+		self._main_ch: Optional[np.ndarray] = None
+		self._main_biome: Optional[np.ndarray] = None
+		self._main_fg: Optional[np.ndarray] = None
+		self._main_hidden: Optional[np.ndarray] = None
+		# What each panel was last drawn from, to skip unchanged redraws
+		self._panel_keys: Dict[str, tuple] = {}
+		self.refresh_consoles()
+
+	def refresh_consoles(self):
+		"""Look up the display's console layers again.
+
+		The layers are cached so rendering doesn't look them up by name every
+		frame; call this whenever the display manager recreates them.
+		"""
+		self._console_main = self.display_manager.get_console("main")
+		self._console_status = self.display_manager.get_console("status")
+		self._console_message_log = self.display_manager.get_console("message_log")
+		self._console_minimap = self.display_manager.get_console("minimap")
+		self._panel_keys.clear()
+		self._build_static_frames()
+
+	def _build_static_frames(self):
+		"""Pre-render the static frames and titles of the panels.
+
+		They are kept as tile arrays and copied into the panels each frame.
+		"""
+		self._main_frame = None
+		self._status_frame = None
+		self._message_log_frame = None
+		self._minimap_frame = None
+		# Row 1 spans of the status bar's last dynamic text; None until the
+		# whole frame has been drawn
+		self._status_spans = None
+		
+		console = self._console_main
+		if console:
+			frame = tcod.console.Console(console.width, console.height)
+			frame.draw_frame(0, 0, console.width, console.height)
+			title = "  World View  "
+			frame.print((console.width - len(title)) // 2, 0, title, fg=(255, 255, 255))
+			self._main_frame = frame.rgb
+		
+		console = self._console_status
+		if console:
+			frame = tcod.console.Console(console.width, console.height)
+			# Status indicator
+			frame.print(1, 1, "Status: Active", fg=(0, 255, 0))
+			# HP display on the right
+			frame.print(console.width - 20, 1, "HP: 100/100", fg=(255, 0, 0))
+			self._status_frame = frame.rgb
+		
+		console = self._console_message_log
+		if console:
+			frame = tcod.console.Console(console.width, console.height)
+			frame.draw_frame(0, 0, console.width, console.height)
+			title = " Messages "
+			frame.print((console.width - len(title)) // 2, 0, title, fg=(255, 255, 255))
+			self._message_log_frame = frame.rgb
+		
+		console = self._console_minimap
+		if console:
+			frame = tcod.console.Console(console.width, console.height)
+			frame.draw_frame(0, 0, console.width, console.height)
+			title = " World Map "
+			frame.print((console.width - len(title)) // 2, 0, title, fg=(255, 255, 255))
+			self._minimap_frame = frame.rgb
+        
+	def _panel_changed(self, name: str, key: tuple) -> bool:
+		"""Record what a panel is drawn from; False if it matches the last draw."""
+		if self._panel_keys.get(name) == key:
+			return False
+		self._panel_keys[name] = key
+		return True
+
+	def _player_pos(self) -> Optional[Tuple[int, int]]:
+		return (self.player.x, self.player.y) if self.player else None
         
 	def set_world_data(self, world_data):
 		"""Update the world data used for rendering maps."""
-		print(f"Setting world data with {len(world_data.get('settlements', []))} settlements")
+		logger.debug("Setting world data with %d settlements", len(world_data.get('settlements', [])))
 		self.world_data = world_data
+		self._settlement_by_pos = {}
+		for settlement in world_data.get('settlements', []):
+			# Check if settlement has position attribute
+			if hasattr(settlement, 'position'):
+				settlement_y, settlement_x = settlement.position
+				self._settlement_by_pos.setdefault((int(settlement_y), int(settlement_x)), settlement)
+		self.invalidate_minimap_cache()
+
+	def invalidate_minimap_cache(self):
+		"""Rebuild what the minimap draws from and redraw it on the next frame.
+
+		Call this after changing the world data, such as its discovery mask,
+		in place.
+		"""
+		world_data = self.world_data
+		# Create a complete world data dictionary including settlements
+		self._minimap_render_data = {
+			'heightmap': world_data.get('heightmap'),
+			'biome_map': world_data.get('biome_map'),
+			'settlements': world_data.get('settlements', []),
+			'discovery_mask': world_data.get('discovery_mask')
+		}
+		self._panel_keys.pop("minimap", None)
         
 	def set_performance_monitor(self, monitor):
 		"""Set the performance monitor for debug information."""
@@ -36,12 +196,16 @@ class UIManager:
 		"""Set the player character for rendering."""
 		self.player = player
         
+	def set_mouse_tile(self, tile: Tuple[int, int]):
+		"""Set the console tile under the mouse for the status bar readout."""
+		self.mouse_tile = tile
+        
 	def render_game_screen(self):
 		"""Render the main game screen with all UI elements."""
 		# render_start = time.perf_counter()
 		
-		self.display_manager.clear_all()
-		
+		# Each panel clears and redraws itself only when its inputs changed;
+		# unchanged panels keep last frame's tiles
 		self._render_main_view()
 		self._render_status_bar()
 		self._render_minimap()
@@ -56,89 +220,109 @@ class UIManager:
         
 	def _render_main_view(self):
 		"""Render the main game view."""
-		console = self.display_manager.get_console("main")
-		if not console or not self.world_data or not self.player:
+		console = self._console_main
+		if not console:
+			return
+		key = (id(self.world_data), self._player_pos(), self.use_los)
+		if not self._panel_changed("main", key):
+			return
+		
+		if not self.world_data or not self.player:
+			# World is still being generated in the background
+			console.rgb[...] = self._main_frame
+			text = "Generating world..."
+			console.print((console.width - len(text)) // 2, console.height // 2, text, fg=(200, 200, 200))
+			self.display_manager.mark_dirty("main")
 			return
 			
 		# Get the console dimensions (excluding a 1-cell border)
 		view_width = console.width - 2
 		view_height = console.height - 2
 		
+		if self._main_ch is None or self._main_ch.shape != (view_height, view_width):
+			self._main_ch = np.empty((view_height, view_width), dtype=np.int32)
+			self._main_biome = np.empty((view_height, view_width), dtype=np.int8)
+			self._main_fg = np.empty((view_height, view_width, 3), dtype=np.uint8)
+			self._main_hidden = np.empty((view_height, view_width), dtype=bool)
+		
 		# Get the player's current position
-		center_pos = (int(self.player.y), int(self.player.x))
+		center_pos = (self.player.y, self.player.x)
 		
 		# Render the local map centered on the player
-		ascii_map, biome_info = self.map_renderer.render_local_map(
+		ch, biome_info = self.map_renderer.render_local_codes(
 			self.world_data,
 			center_pos,
 			view_width,
-			view_height
+			view_height,
+			out=(self._main_ch, self._main_biome)
 		)
 		
-		# Calculate visible positions if LOS is enabled
-		if self.use_los:
+		# Calculate visible positions if LOS is enabled, reusing the last
+		# result while the player and map haven't changed
+		los_key = (center_pos, view_height, view_width, id(self.world_data))
+		if self.use_los and (los_key != self._los_key or self.visible_mask is None):
 			# Since the local map is centered on the player, they will be at the center of the view
 			view_center = (view_height // 2, view_width // 2)
-			self.visible_positions = self.map_renderer.calculate_los(
-				ascii_map,
+			self.visible_mask = self.map_renderer.calculate_los_mask(
+				ch,
 				view_center,  # Player is at the center of the view
 				view_height,
 				view_width
 			)
+			np.logical_not(self.visible_mask, out=self._main_hidden)
+			self._los_key = los_key
 		
-		# Draw frame around the map
-		console.draw_frame(0, 0, console.width, console.height, title=" World View ")
+		# Copy in the pre-rendered frame around the map
+		console.rgb[...] = self._main_frame
+		self.display_manager.mark_dirty("main")
 		
-		# Draw the map to the console
-		for y in range(len(ascii_map)):
-			for x in range(len(ascii_map[0])):
-				# Skip if position is not visible and LOS is enabled
-				if self.use_los and (y, x) not in self.visible_positions:
-					console.print(x+1, y+1, ' ', fg=(0, 0, 0))
-					continue
-				
-				symbol = ascii_map[y][x]
-				# Get biome type from the biome_info dictionary
-				biome_type = biome_info.get(f"{y},{x}")
-				
-				# Draw the character with appropriate color
-				if symbol == self.player.char:
-					# Draw player in white
-					console.print(x+1, y+1, symbol, fg=(255, 255, 255))
-				else:
-					color = self._get_terrain_color(symbol, biome_type)
-					console.print(x+1, y+1, symbol, fg=color)
+		# Build the map's tiles as arrays and write them in one pass
+		fg = self._terrain_colors(ch, biome_info, out=self._main_fg)
+		
+		# Draw player in white
+		fg[ch == ord(self.player.char)] = (255, 255, 255)
+		
+		# Blank positions that aren't visible when LOS is enabled
+		if self.use_los:
+			hidden = self._main_hidden
+			ch[hidden] = ord(" ")
+			fg[hidden] = 0
+		
+		height, width = ch.shape
+		tiles = console.rgb[1:1 + height, 1:1 + width]
+		tiles["ch"] = ch
+		tiles["fg"] = fg
             
 	def _render_status_bar(self):
 		"""Render the status bar with optional performance metrics."""
-		console = self.display_manager.get_console("status")
+		console = self._console_status
 		if console:
-			# Status indicator
-			console.print(1, 1, "Status: Active", fg=(0, 255, 0))
+			fps_text = None
+			if self.debug and self.performance_monitor:
+				metrics = self.performance_monitor.get_performance_summary()
+				fps_text = f"FPS: {metrics['fps']:.1f}"
+			mouse_text = None
+			if self.mouse_tile:
+				mouse_text = f"Mouse: {self.mouse_tile[0]}, {self.mouse_tile[1]}"
+			key = (id(self.world_data), self._player_pos(), fps_text, mouse_text)
+			if not self._panel_changed("status", key):
+				return
 			
 			# Get current biome if world data and player exist
 			current_biome = "Unknown"
 			current_location = None
 			if self.world_data and self.player:
+				player_y, player_x = self.player.y, self.player.x
+				
 				# Get biome information
 				biome_map = self.world_data.get('biome_map')
 				if biome_map is not None:
 					# Get biome at player position
-					player_y, player_x = int(self.player.y), int(self.player.x)
 					if 0 <= player_y < biome_map.shape[0] and 0 <= player_x < biome_map.shape[1]:
-						biome_value = biome_map[player_y, player_x]
-						current_biome = BiomeType(biome_value).name.replace('_', ' ').title()
+						current_biome = _BIOME_NAMES.get(int(biome_map[player_y, player_x]), current_biome)
 				
 				# Check for settlements/POIs at player position
-				settlements = self.world_data.get('settlements', [])
-				for settlement in settlements:
-					# Check if settlement has position attribute
-					if hasattr(settlement, 'position'):
-						settlement_y, settlement_x = settlement.position
-						if (int(settlement_y) == int(self.player.y) and 
-							int(settlement_x) == int(self.player.x)):
-							current_location = settlement
-							break
+				current_location = self._settlement_by_pos.get((player_y, player_x))
 			
 			# Construct status text
 			status_text = f"{current_biome}"
@@ -157,41 +341,61 @@ class UIManager:
 						else:
 							status_text += ": Unexplored"
 				except Exception as e:
-					print(f"Error formatting location: {e}")
+					logger.debug("Error formatting location: %s", e)
+			
+			# Moving within the same area leaves the text as it was
+			if not self._panel_changed("status_text", (status_text, fps_text, mouse_text)):
+				return
+			
+			# Only the text spans drawn last time change; restore the static
+			# layout under them rather than clearing the whole bar
+			frame = self._status_frame
+			if self._status_spans is None:
+				console.rgb[...] = frame
+			else:
+				for x0, x1 in self._status_spans:
+					console.rgb[1, x0:x1] = frame[1, x0:x1]
+			self.display_manager.mark_dirty("status")
+			spans = []
 			
 			# Print status text in the middle
 			status_x = (console.width - len(status_text)) // 2
 			console.print(status_x, 1, status_text, fg=(255, 255, 255))
+			spans.append((max(status_x, 0), status_x + len(status_text)))
 			
-			# HP display on the right
-			console.print(console.width - 20, 1, "HP: 100/100", fg=(255, 0, 0))
+			# HP display on the right stays on top of the status text
+			hp_x = console.width - 20
+			console.rgb[1, hp_x:hp_x + 11] = frame[1, hp_x:hp_x + 11]
 			
 			# Add performance metrics in debug mode
-			if self.debug and self.performance_monitor:
-				metrics = self.performance_monitor.get_performance_summary()
-				fps_text = f"FPS: {metrics['fps']:.1f}"
-				console.print(console.width - 45, 1, fps_text, fg=(255, 255, 0))
+			if fps_text:
+				fps_x = console.width - 45
+				console.print(fps_x, 1, fps_text, fg=(255, 255, 0))
+				spans.append((max(fps_x, 0), fps_x + len(fps_text)))
+			
+			# Mouse readout goes on top, so it is redrawn whenever the row is
+			if mouse_text:
+				console.print(_MOUSE_STATUS_X, 1, mouse_text, fg=(200, 200, 200))
+				spans.append((_MOUSE_STATUS_X, _MOUSE_STATUS_X + len(mouse_text)))
+			
+			self._status_spans = spans
             
 	def _render_minimap(self):
 		"""Render the world map in minimap console."""
-		console = self.display_manager.get_console("minimap")
+		console = self._console_minimap
 		if not console or not self.world_data:
 			return
+		if not self._panel_changed("minimap", (id(self.world_data), self._player_pos())):
+			return
 			
 		# Get console dimensions (excluding frame)
 		map_width = console.width - 2
 		map_height = console.height - 2
 		
-		# Create a complete world data dictionary including settlements
-		render_data = {
-			'heightmap': self.world_data.get('heightmap'),
-			'biome_map': self.world_data.get('biome_map'),
-			'settlements': self.world_data.get('settlements', []),
-			'discovery_mask': self.world_data.get('discovery_mask')
-		}
+		render_data = self._minimap_render_data
 		
 		# Render the world map with player
-		ascii_map, biome_info = self.map_renderer.render_world_map(
+		ch, biome_info = self.map_renderer.render_world_codes(
 			render_data,
 			map_width,
 			map_height,
@@ -199,78 +403,45 @@ class UIManager:
 			self.player
 		)
 		
-		# Add frame
-		framed_map = self.map_renderer.add_frame(ascii_map)
-		
-		# Draw title
-		title = " World Map "
-		title_x = (console.width - len(title)) // 2
-		console.print(title_x, 0, title, fg=(255, 255, 255))
+		self.display_manager.mark_dirty("minimap")
 		
-		# Draw the map with appropriate colors
-		for y in range(len(framed_map)):
-			for x in range(len(framed_map[0])):
-				char = framed_map[y][x]
-				# Convert to string if it's an integer
-				if isinstance(char, int):
-					char = chr(char)
-				# Get biome type for this position
-				biome_type = biome_info.get(f"{y},{x}")
-				# Set colors based on terrain type
-				fg = self._get_terrain_color(char, biome_type)
-				console.print(x, y, char, fg=fg)
+		# Copy in the pre-rendered frame and title, then draw the map
+		# inside it with appropriate colors in one pass
+		console.rgb[...] = self._minimap_frame
+		fg = self._terrain_colors(ch, biome_info)
+		height, width = ch.shape
+		tiles = console.rgb[1:1 + height, 1:1 + width]
+		tiles["ch"] = ch
+		tiles["fg"] = fg
             
-	def _get_terrain_color(self, char: str, biome_type: Optional[BiomeType] = None) -> Tuple[int, int, int]:
-		"""Get the color for a terrain or settlement symbol."""
-		# Special case for forests in cold biomes
-		if char == '♠' and biome_type in [BiomeType.TUNDRA, BiomeType.COLD_DESERT]:
-			return (200, 200, 200)  # White-ish trees for cold forests
-		if char == '^' and biome_type in [BiomeType.TEMPERATE_FOREST, BiomeType.TEMPERATE_RAINFOREST, BiomeType.TROPICAL_RAINFOREST]:
-			return (139, 69, 19)  # Brown earthy mountains for warm forests
+	def _terrain_colors(self, ch: np.ndarray, biome_info: np.ndarray,
+					   out: Optional[np.ndarray] = None) -> np.ndarray:
+		"""Get the (H, W, 3) colors for arrays of terrain code points and biome IDs.
+
+		The colors are written to out if it is given.
+		"""
+		# Base colors come straight from the lookup table; code points past
+		# its end clip to the white default
+		fg = np.take(_TERRAIN_COLOR_LUT, ch, axis=0, mode="clip", out=out)
 		
-		TERRAIN_COLORS = {
-			'≈': (0, 148, 255),    # Deep water (blue)
-			'~': (65, 185, 255),   # Shallow water (light blue)
-			'.': (100, 220, 100),  # Plains (green)
-			chr(239): (160, 160, 160),  # Hills (gray)
-			'^': (128, 128, 128),  # Mountains (dark gray)
-			'▲': (200, 200, 200),  # Peaks (light gray)
-			'♠': (0, 180, 0),      # Forest (dark green)
-			'∙': (255, 255, 150),  # Desert (yellow)
-			',': (200, 200, 200),  # Tundra (white)
-			':': (255, 240, 150),  # Beach (sand)
-			'?': (100, 100, 100),  # Unknown (dark gray)
-			chr(0x263C): (255, 215, 0),    # Capital city (gold)
-			'*': (215, 175, 220),  # Major city (mustard)
-			chr(0x2219): (180, 180, 180),  # Minor city (darker gray)
-			chr(0x2302): (180, 180, 180),  # Village (darker gray)
-			chr(0x03C6): (180, 70, 70),  # Ruins (darker gray)
-			chr(0x03A9): (220, 70, 70),  # Dungeon (darker gray)
-			'+': (150, 15, 225),  # Temple (mustard)
-			'@': (255, 128, 255),  # Player character (lavender)
-			# Frame characters
-			'┌': (255, 255, 255),  # White
-			'┐': (255, 255, 255),
-			'└': (255, 255, 255),
-			'┘': (255, 255, 255),
-			'─': (255, 255, 255),
-			'│': (255, 255, 255),
-		}
-		return TERRAIN_COLORS.get(char, (255, 255, 255))
+		# Only forests and mountains vary by biome
+		fg[(ch == ord('♠')) & np.isin(biome_info, _COLD_BIOMES)] = (200, 200, 200)  # White-ish trees for cold forests
+		fg[(ch == ord('^')) & np.isin(biome_info, _FOREST_BIOMES)] = (139, 69, 19)  # Brown earthy mountains for warm forests
+		return fg
             
 	def _render_message_log(self):
 		"""Render the message log."""
-		console = self.display_manager.get_console("message_log")
+		console = self._console_message_log
 		if console and self.message_manager:
-			# Draw frame without title
-			console.draw_frame(0, 0, console.width, console.height)
+			if not self._panel_changed("message_log", (self.message_manager.revision,)):
+				return
+			self.display_manager.mark_dirty("message_log")
 			
-			# Draw title manually
-			title = " Messages "
-			title_x = (console.width - len(title)) // 2  # Center the title
-			console.print(title_x, 0, title, fg=(255, 255, 255))
+			# Copy in the pre-rendered frame and title; this also blanks
+			# the interior
+			console.rgb[...] = self._message_log_frame
 			
-			# Render messages
+			# Messages queued since the last frame are wrapped as they render
 			self.message_manager.render_messages(console)
 
 	def toggle_los(self):
@@ -1,7 +1,8 @@
 from dataclasses import dataclass, field
-from typing import Tuple, Set
+from typing import Tuple
+import numpy as np
 
-@dataclass
+@dataclass(slots=True)
 class Player:
     """
     Represents the player character in the game world.
@@ -9,15 +10,24 @@ class Player:
     Attributes:
         x (int): The player's x-coordinate in the world
         y (int): The player's y-coordinate in the world
+        world_width (int): Width of the world the player moves in
+        world_height (int): Height of the world the player moves in
         char (str): The character used to represent the player on the map
         color (Tuple[int, int, int]): RGB color tuple for rendering the player
-        visited_locations (Set[Tuple[int, int]]): Set of coordinates the player has visited
+        visited (np.ndarray): Boolean [y, x] map of the world positions the player has visited
     """
     x: int
     y: int
+    world_width: int
+    world_height: int
     char: str = "@"
     color: Tuple[int, int, int] = (255, 200, 255)  # lavender color by default
-    visited_locations: Set[Tuple[int, int]] = field(default_factory=set)
+    visited: np.ndarray = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.x = int(self.x)
+        self.y = int(self.y)
+        self.visited = np.zeros((self.world_height, self.world_width), dtype=np.bool_)
     
     def move(self, dx: int, dy: int) -> None:
         """
@@ -27,9 +37,9 @@ class Player:
             dx (int): Change in x-coordinate
             dy (int): Change in y-coordinate
         """
-        self.x += dx
-        self.y += dy
-        self.visited_locations.add((self.x, self.y))
+        self.x += int(dx)
+        self.y += int(dy)
+        self._mark_visited(self.x, self.y)
     
     def teleport(self, x: int, y: int) -> None:
         """
@@ -39,9 +49,13 @@ class Player:
             x (int): New x-coordinate
             y (int): New y-coordinate
         """
-        self.x = x
-        self.y = y
-        self.visited_locations.add((x, y))
+        self.x = int(x)
+        self.y = int(y)
+        self._mark_visited(self.x, self.y)
+    
+    def _mark_visited(self, x: int, y: int) -> None:
+        if 0 <= y < self.world_height and 0 <= x < self.world_width:
+            self.visited[y, x] = True
     
     @property
     def position(self) -> Tuple[int, int]:
@@ -58,4 +72,7 @@ class Player:
         Returns:
             bool: True if the player has visited this position, False otherwise
         """
-        return position in self.visited_locations
+        x, y = int(position[0]), int(position[1])
+        if 0 <= y < self.world_height and 0 <= x < self.world_width:
+            return bool(self.visited[y, x])
+        return False
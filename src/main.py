@@ -1,6 +1,5 @@
 # src/main.py
 
-import tcod
 from src.engine.display_manager import DisplayManager
 from src.engine.input_handler import InputHandler, GameState
 from src.utils.logger_config import logger
@@ -15,7 +14,7 @@ from src.utils.performance_monitor import PerformanceMonitor
 def main() -> None:
 	"""Main game entry point."""
 	# Initialize configuration manager
-	config_manager = ConfigurationManager()
+	config_manager = ConfigurationManager.get_instance()
 	
 	# Load configurations
 	display_config = config_manager.get_display_config()
@@ -49,6 +48,15 @@ def main() -> None:
 	ui_manager.set_performance_monitor(performance_monitor)
 	
 	state_manager = GameStateManager(message_manager)
+	
+	# Vsync only pays off in the animated game world; menu screens are
+	# input-latency bound, so run them unsynced under the frame limiter
+	for menu_state in (GameState.MAIN_MENU, GameState.INVENTORY, GameState.CHARACTER_SCREEN):
+		state_manager.register_state_callback(menu_state, lambda: display_manager.set_vsync(False))
+	state_manager.register_state_callback(
+		GameState.GAME_WORLD,
+		lambda: display_manager.set_vsync(display_config.vsync)
+	)
 	state_manager.change_state(GameState.MAIN_MENU)
 	
 	# Initialize input handler with keybindings and debug settings
@@ -71,18 +79,18 @@ def main() -> None:
 	)
 	
 	# Initial messages
-	message_manager.add_message("Welcome to Nihilis!", fg=(255, 223, 0))
-	message_manager.add_message("You enter the region.", fg=(255, 255, 255))
-	message_manager.add_message("You see BIG mountains.", fg=(192, 192, 192))
-	message_manager.add_message("A cool breeze blows.", fg=(128, 192, 255))
-	message_manager.add_message("Arte is a really serious damned hottie!", fg=(255, 192, 255))
+	message_manager.bulk_add([
+		("Welcome to Nihilis!", (255, 223, 0)),
+		("You enter the region.", (255, 255, 255)),
+		("You see BIG mountains.", (192, 192, 192)),
+		("A cool breeze blows.", (128, 192, 255)),
+		("Arte is a really serious damned hottie!", (255, 192, 255)),
+	])
 	
 	# Create and run game loop
 	# game_loop = GameLoop(display_manager, input_handler, state_manager, message_manager, ui_manager)
-	try:
+	with display_manager:
 		game_loop.run()
-	finally:
-		display_manager.close()
 
 if __name__ == "__main__":
 	main()
\ No newline at end of file
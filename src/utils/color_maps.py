@@ -1,4 +1,16 @@
 # src/utils/color_maps.py
+import numpy as np
+
+# Upper bounds of the height bands and their colors, matching height_to_color
+_THRESHOLDS = np.array([0.3, 0.4, 0.5, 0.7])
+_PALETTE = np.array([
+    (0, 0, 139),     # Deep water
+    (0, 0, 255),     # Shallow water
+    (34, 139, 34),   # Plains
+    (139, 69, 19),   # Hills
+    (128, 128, 128), # Mountains
+], dtype=np.uint8)
+
 def height_to_color(height: float) -> tuple[int, int, int]:
     """Convert a height value to a color."""
     if height < 0.3:  # Deep water
@@ -12,3 +24,9 @@ def height_to_color(height: float) -> tuple[int, int, int]:
     else:  # Mountains
         return (128, 128, 128)
 
+def heightmap_to_rgb(heights: np.ndarray) -> np.ndarray:
+    """Convert an array of heights to an (..., 3) uint8 array of colors.
+
+    Gives the same colors as height_to_color, in one pass over the array.
+    """
+    return _PALETTE[np.digitize(heights, _THRESHOLDS)]
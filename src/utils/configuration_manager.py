@@ -1,7 +1,7 @@
-import json
-import yaml
+import copy
 import logging
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Dict, Optional, Union, List
 from dataclasses import dataclass
 from enum import Enum, auto
@@ -9,6 +9,18 @@ from src.world.terrain_settings import TerrainSettings
 from typing import Optional
 from src.world.terrain_settings import ErosionSettings
 
+# PyYAML takes tens of milliseconds to import, so it is only imported once a
+# config file is actually read or written. libyaml's C loader and emitter
+# are several times faster; fall back to the pure-Python ones when PyYAML
+# was built without them.
+def _load_yaml(stream) -> Any:
+    import yaml
+    return yaml.load(stream, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+def _dump_yaml(data: Any, stream) -> None:
+    import yaml
+    yaml.dump(data, stream, Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper), default_flow_style=False)
+
 class ConfigScope(Enum):
     """Defines different configuration scopes."""
     SYSTEM = auto()    # System-wide settings (display, performance, etc.)
@@ -58,8 +70,8 @@ class KeyBindings:
 class ConfigurationManager:
     """Manages game configuration settings."""
     
-    DEFAULT_CONFIG = {
-        "display": {
+    DEFAULT_CONFIG = MappingProxyType({
+        "display": MappingProxyType({
             "screen_width": 80,
             "screen_height": 50,
             "fullscreen": False,
@@ -69,16 +81,16 @@ class ConfigurationManager:
             "font_path": "resources/fonts/terminal16x16_gs_ro.png",
             "font_width": 16,
             "font_height": 16
-        },
-        "performance": {
+        }),
+        "performance": MappingProxyType({
             "target_fps": 60,
             "max_messages": 100,
             "log_interval": 5,        # 5 for debug, 300 for prod
             "warning_threshold_fps": 55.0,
             "critical_threshold_fps": 30.0,
             "memory_warning_threshold_mb": 400.0
-        },
-        "keybindings": {
+        }),
+        "keybindings": MappingProxyType({
             "move_up": ["UP", "k"],      # UP arrow and 'k'
             "move_down": ["DOWN", "j"],    # DOWN arrow and 'j'
             "move_left": ["LEFT", "h"],    # LEFT arrow and 'h'
@@ -87,24 +99,42 @@ class ConfigurationManager:
             "character": ["c"],          # 'c'
             "quit": ["ESC"],              # ESC
             "debug_overlay": ["F3"]      # F3
-        },
-        "debug": {
+        }),
+        "debug": MappingProxyType({
             "enabled": False,
             "show_fps": True,
             "log_input": False,
             "god_mode": False
-        }
-    }
+        })
+    })
+    # Every (section, key, default) triple, flattened once for _validate_config
+    _DEFAULT_ITEMS = tuple(
+        (section, key, value)
+        for section, defaults in DEFAULT_CONFIG.items()
+        for key, value in defaults.items()
+    )
+    
+    _instance: Optional['ConfigurationManager'] = None
+    
+    @classmethod
+    def get_instance(cls) -> 'ConfigurationManager':
+        """Get the shared configuration manager, loading it on first use."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
     
     def __init__(self, config_dir: Path = Path("config")):
         self.config_dir = config_dir
         self.config_dir.mkdir(exist_ok=True)
         self.config: Dict[str, Any] = {}
+        # Objects built from self.config, dropped whenever it changes
+        self._cache: Dict[str, Any] = {}
         self.logger = logging.getLogger('config')
         
         # Load or create default configuration
         if not self.load_config():
-            self.config = self.DEFAULT_CONFIG.copy()
+            self.config = {}
+            self._validate_config()
             self.save_config()
             
     def load_config(self) -> bool:
@@ -113,7 +143,7 @@ class ConfigurationManager:
         try:
             if config_file.exists():
                 with open(config_file, 'r') as f:
-                    self.config = yaml.safe_load(f)
+                    self.config = _load_yaml(f)
                 self._validate_config()
                 return True
         except Exception as e:
@@ -124,7 +154,7 @@ class ConfigurationManager:
         """Save current configuration to file."""
         try:
             with open(self.config_dir / "config.yaml", 'w') as f:
-                yaml.dump(self.config, f, default_flow_style=False)
+                _dump_yaml(self.config, f)
             return True
         except Exception as e:
             self.logger.error(f"Error saving config: {e}")
@@ -132,27 +162,32 @@ class ConfigurationManager:
             
     def get_display_config(self) -> DisplayConfig:
         """Get display configuration settings."""
-        display = self.config.get('display', self.DEFAULT_CONFIG['display'])
-        return DisplayConfig(**display)
+        if 'display' not in self._cache:
+            self._cache['display'] = DisplayConfig(**self.config['display'])
+        return self._cache['display']
         
     def get_performance_config(self) -> PerformanceConfig:
         """Get performance configuration settings."""
-        perf = self.config.get("performance", self.DEFAULT_CONFIG["performance"])
-        
-        # If the old key exists, migrate it to the new key
-        if "logging_interval" in perf:
-            perf["log_interval"] = perf.pop("logging_interval")
-            
-        return PerformanceConfig(**perf)
+        if 'performance' not in self._cache:
+            self._cache['performance'] = PerformanceConfig(**self.config['performance'])
+        return self._cache['performance']
         
     def get_keybindings(self) -> KeyBindings:
         """Get key binding configuration."""
-        bindings = self.config.get('keybindings', self.DEFAULT_CONFIG['keybindings'])
-        return KeyBindings(**bindings)
+        if 'keybindings' not in self._cache:
+            self._cache['keybindings'] = KeyBindings(**self.config['keybindings'])
+        return self._cache['keybindings']
+        
+    def get_key_action_map(self) -> Dict[str, str]:
+        """Get a {key name: binding field} map of the key bindings, built once per config."""
+        if 'key_map' not in self._cache:
+            bindings = self.config['keybindings']
+            self._cache['key_map'] = {key: action for action, keys in bindings.items() for key in keys}
+        return self._cache['key_map']
         
     def get_debug_settings(self) -> Dict[str, bool]:
         """Get debug configuration settings."""
-        return self.config.get('debug', self.DEFAULT_CONFIG['debug'])
+        return self.config['debug']
     
     def get_terrain_settings(self) -> TerrainSettings:
         """Get terrain generation settings from config."""
@@ -202,20 +237,30 @@ class ConfigurationManager:
             return False
             
     def _validate_config(self) -> None:
-        """Validate configuration and fill in missing values."""
-        for section, defaults in self.DEFAULT_CONFIG.items():
-            if section not in self.config:
-                self.config[section] = defaults
-            else:
-                for key, value in defaults.items():
-                    if key not in self.config[section]:
-                        self.config[section][key] = value
+        """Validate configuration and fill in missing values.
+        
+        Afterwards every default section and key is present, so the getters
+        can read self.config directly.
+        """
+        self._cache.clear()
+        
+        # If the old key exists, migrate it to the new key
+        perf = self.config.get('performance')
+        if perf and "logging_interval" in perf:
+            perf["log_interval"] = perf.pop("logging_interval")
+        
+        config = self.config
+        for section, key, value in self._DEFAULT_ITEMS:
+            values = config.setdefault(section, {})
+            if key not in values:
+                # Copy so edits to the config never reach the defaults
+                values[key] = copy.deepcopy(value)
                         
     def export_config(self, file_path: Path) -> bool:
         """Export configuration to a file."""
         try:
             with open(file_path, 'w') as f:
-                yaml.dump(self.config, f, default_flow_style=False)
+                _dump_yaml(self.config, f)
             return True
         except Exception as e:
             self.logger.error(f"Error exporting config: {e}")
@@ -225,7 +270,7 @@ class ConfigurationManager:
         """Import configuration from a file."""
         try:
             with open(file_path, 'r') as f:
-                new_config = yaml.safe_load(f)
+                new_config = _load_yaml(f)
             self.config = new_config
             self._validate_config()
             return self.save_config()
@@ -1,5 +1,10 @@
 import logging
 
+# None of our formats use thread or process info, so skip collecting it for every record
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
 # Configure logging
 logging.basicConfig(
     level=logging.WARNING,  # Set the logging level to WARNING
@@ -10,4 +15,6 @@ logging.basicConfig(
 )
 
 # Create a logger for the application
-logger = logging.getLogger('nihilis')
\ No newline at end of file
+logger = logging.getLogger('nihilis')
+# Set explicitly so filtered debug calls return before formatting their arguments
+logger.setLevel(logging.WARNING)
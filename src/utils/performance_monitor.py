@@ -1,8 +1,33 @@
+import os
+import sys
 import time
+import queue
+import atexit
 import logging
+import logging.handlers
+import weakref
 import psutil
+import numpy as np
 from pathlib import Path
-from collections import deque
+from typing import Optional, Tuple
+
+# Seconds of INFO records held in memory before they are written out;
+# warnings and errors are written immediately
+_LOG_FLUSH_SECONDS = 30
+
+# Background thread writing the performance log; replaced, not stacked,
+# when another monitor sets logging up again
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+def _stop_log_listener() -> None:
+	global _log_listener
+	if _log_listener is not None:
+		_log_listener.stop()
+		for handler in _log_listener.handlers:
+			handler.close()
+		_log_listener = None
+
+atexit.register(_stop_log_listener)
 
 class PerformanceMonitor:
 	"""Monitors and logs system performance metrics."""
@@ -16,7 +41,13 @@ class PerformanceMonitor:
 					target_fps: int = 60,
 					max_messages: int = 100):
 		# print(f"Initializing PerformanceMonitor with log_interval: {log_interval}")
-		self.frame_metrics = deque(maxlen=window_size)
+		# Ring buffers of the last window_size frames' end timestamps and
+		# durations; _next is the slot the next frame is written to
+		self.window_size = window_size
+		self._timestamps = np.zeros(window_size)
+		self._frame_times = np.zeros(window_size)
+		self._next = 0
+		self._filled = 0
 		self.frame_count = 0
 		self.last_frame_time = time.perf_counter()
 		self.last_log_time = time.perf_counter()
@@ -28,6 +59,9 @@ class PerformanceMonitor:
 		self.target_fps = target_fps
 		self.max_messages = max_messages
 		self.process = psutil.Process()
+		self._setup_statm()
+		# (time read, RSS in MB) of the last memory reading
+		self._memory_cache = (float('-inf'), 0.0)
 		
 		# Set up logging
 		self._setup_logging()
@@ -57,14 +91,49 @@ class PerformanceMonitor:
 		)
 		file_handler.setFormatter(formatter)
 		
+		# Buffer about _LOG_FLUSH_SECONDS of interval logs before writing,
+		# flushing straight away on warnings and errors
+		buffered_handler = logging.handlers.MemoryHandler(
+			capacity=max(1, int(_LOG_FLUSH_SECONDS / max(self.log_interval, 1))),
+			flushLevel=logging.WARNING,
+			target=file_handler
+		)
+		
+		# The game loop only enqueues records; a background thread formats
+		# and writes them
+		global _log_listener
+		_stop_log_listener()
+		log_queue = queue.SimpleQueue()
+		_log_listener = logging.handlers.QueueListener(log_queue, buffered_handler)
+		_log_listener.start()
+		
 		# Add handler to logger
-		self.perf_logger.addHandler(file_handler)
+		self.perf_logger.addHandler(logging.handlers.QueueHandler(log_queue))
 		
 		# Prevent propagation to root logger
 		self.perf_logger.propagate = False
 		
 		# print(f"Performance logging initialized. Log file: {log_path}")
         
+	def _setup_statm(self):
+		"""On Linux, keep /proc/self/statm open to read RSS without psutil."""
+		self._statm_fd = None
+		self._page_size = 0
+		if sys.platform.startswith('linux'):
+			try:
+				self._statm_fd = os.open('/proc/self/statm', os.O_RDONLY)
+			except OSError:
+				return
+			self._page_size = os.sysconf('SC_PAGE_SIZE')
+			weakref.finalize(self, os.close, self._statm_fd)
+        
+	def _rss_bytes(self) -> int:
+		"""Resident set size of this process in bytes."""
+		if self._statm_fd is not None:
+			# statm fields are in pages: size, resident, shared, ...
+			return int(os.pread(self._statm_fd, 128, 0).split()[1]) * self._page_size
+		return self.process.memory_info().rss
+        
 	def start_frame(self):
 		"""Start timing a new frame."""
 		self.frame_start_time = time.perf_counter()
@@ -75,10 +144,12 @@ class PerformanceMonitor:
 		frame_time = current_time - self.frame_start_time
 		
 		# Store individual frame metric
-		self.frame_metrics.append({
-			'timestamp': current_time,
-			'frame_time': frame_time
-		})
+		i = self._next
+		self._timestamps[i] = current_time
+		self._frame_times[i] = frame_time
+		self._next = (i + 1) % self.window_size
+		if self._filled < self.window_size:
+			self._filled += 1
 		self.frame_count += 1
 		
 		# Log performance data at intervals
@@ -86,31 +157,39 @@ class PerformanceMonitor:
 			self._log_performance_data()
 			self.last_log_time = current_time
         
+	def _recent_frames(self) -> Tuple[np.ndarray, np.ndarray]:
+		"""Timestamps and frame times of the recorded frames, oldest first."""
+		if self._filled < self.window_size:
+			return self._timestamps[:self._filled], self._frame_times[:self._filled]
+		order = np.roll(np.arange(self.window_size), -self._next)
+		return self._timestamps[order], self._frame_times[order]
+        
 	def _log_performance_data(self):
 		"""Log performance metrics."""
-		if not self.frame_metrics:
+		if not self._filled:
 			return
 			
 		current_time = time.perf_counter()
 		
-		# Calculate metrics over the logging interval
+		# Calculate metrics over the logging interval; timestamps are
+		# ascending, so the interval is a suffix of the recent frames
 		interval_start = current_time - self.log_interval
-		interval_frames = [m for m in self.frame_metrics 
-							if m['timestamp'] >= interval_start]
+		timestamps, frame_times = self._recent_frames()
+		start = np.searchsorted(timestamps, interval_start)
 		
-		if not interval_frames:
+		num_frames = len(timestamps) - start
+		if not num_frames:
 			return
 			
 		# Calculate actual FPS over the interval
-		num_frames = len(interval_frames)
-		actual_interval = current_time - interval_frames[0]['timestamp']
+		actual_interval = current_time - timestamps[start]
 		fps = num_frames / actual_interval if actual_interval > 0 else 0
 		
 		# Calculate average frame time
-		avg_frame_time = sum(f['frame_time'] for f in interval_frames) / num_frames
+		avg_frame_time = frame_times[start:].mean()
 		
 		# Get current memory usage
-		current_memory = self.process.memory_info().rss / (1024 * 1024)  # Convert to MB
+		current_memory = self._memory_usage_mb(current_time)
 		
 		# Prepare log message
 		log_msg = (
@@ -120,34 +199,47 @@ class PerformanceMonitor:
 			f"Memory Usage: {current_memory:.1f}MB"
 		)
 		
+		# The loop skips rendering unchanged frames, so a low render count
+		# during idle play isn't a slowdown. Thresholds are judged on the
+		# rate the measured frame time could sustain instead
+		frame_fps = 1.0 / avg_frame_time if avg_frame_time > 0 else float('inf')
+		
 		# Add warning details if metrics are concerning
 		warnings = []
-		if fps < self.critical_threshold_fps:
-			warnings.append(f"Critical FPS drop (target: {self.target_fps}, current: {fps:.1f})")
-		elif fps < self.warning_threshold_fps:
-			warnings.append(f"Low FPS (target: {self.target_fps}, current: {fps:.1f})")
+		if frame_fps < self.critical_threshold_fps:
+			warnings.append(f"Critical FPS drop (target: {self.target_fps}, current: {frame_fps:.1f})")
+		elif frame_fps < self.warning_threshold_fps:
+			warnings.append(f"Low FPS (target: {self.target_fps}, current: {frame_fps:.1f})")
 		
 		if warnings:
 			log_msg += " | WARNING: " + "; ".join(warnings)
 		
 		# Log with appropriate level based on thresholds
-		if fps < self.critical_threshold_fps:
+		if frame_fps < self.critical_threshold_fps:
 			self.perf_logger.error(log_msg)
-		elif fps < self.warning_threshold_fps:
+		elif frame_fps < self.warning_threshold_fps:
 			self.perf_logger.warning(log_msg)
 		else:
 			self.perf_logger.info(log_msg)
-		for handler in self.perf_logger.handlers:
-			handler.flush()
         
 	def get_performance_summary(self) -> dict:
 		"""Get current performance metrics for display."""
-		if not self.frame_metrics:
+		if not self._filled:
 			return {'fps': 0.0, 'frame_time': 0.0, 'memory_usage': 0.0}
 			
-		latest = self.frame_metrics[-1]
+		# FPS over the recorded window, as _log_performance_data measures it
+		oldest = self._next if self._filled == self.window_size else 0
+		elapsed = time.perf_counter() - self._timestamps[oldest]
 		return {
-			'fps': latest['fps'],
-			'frame_time': latest['frame_time'],
-			'memory_usage': latest['memory_usage'] / (1024 * 1024)  # Convert to MB
-		}
\ No newline at end of file
+			'fps': self._filled / elapsed if elapsed > 0 else 0.0,
+			'frame_time': float(self._frame_times[self._next - 1]),
+			'memory_usage': self._memory_usage_mb(time.perf_counter())
+		}
+        
+	def _memory_usage_mb(self, current_time: float) -> float:
+		"""Resident memory in MB, re-read from the OS at most once a second."""
+		read_time, memory_mb = self._memory_cache
+		if current_time - read_time >= min(self.log_interval, 1.0):
+			memory_mb = self._rss_bytes() / (1024 * 1024)  # Convert to MB
+			self._memory_cache = (current_time, memory_mb)
+		return memory_mb
\ No newline at end of file
@@ -5,6 +5,20 @@ from typing import Optional, Tuple, List
 from pathlib import Path
 from src.world.terrain_settings import TerrainSettings
 
+# Largest grid side handed to matplotlib's surface and contour builders
+_MAX_PLOT_DIM = 256
+
+def _downsample(heightmap: np.ndarray, max_dim: int = _MAX_PLOT_DIM) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Take every n-th row and column so neither side exceeds max_dim.
+    
+    Returns the sampled heights with the x and y pixel coordinates of its
+    columns and rows, so plots stay aligned with the full-size map.
+    """
+    step = max(1, -(-max(heightmap.shape) // max_dim))
+    ys = np.arange(0, heightmap.shape[0], step)
+    xs = np.arange(0, heightmap.shape[1], step)
+    return heightmap[::step, ::step], xs, ys
+
 class TerrainVisualizer:
     """Utility class for visualizing terrain data."""
     
@@ -63,14 +77,13 @@ class TerrainVisualizer:
         fig = plt.figure(figsize=(12, 8))
         ax = fig.add_subplot(111, projection='3d')
         
-        # Create meshgrid for 3D plot
-        x, y = np.meshgrid(
-            np.arange(heightmap.shape[1]),
-            np.arange(heightmap.shape[0])
-        )
+        # Create meshgrid for 3D plot; matplotlib only draws a few dozen
+        # rows and columns of the surface, so a downsampled grid is enough
+        heights, xs, ys = _downsample(heightmap)
+        x, y = np.meshgrid(xs, ys)
         
         # Plot surface
-        surf = ax.plot_surface(x, y, heightmap,
+        surf = ax.plot_surface(x, y, heights,
                              cmap=self.TERRAIN_CMAP,
                              linewidth=0,
                              antialiased=True)
@@ -122,11 +135,15 @@ class TerrainVisualizer:
     def _add_terrain_contours(self, heightmap: np.ndarray):
         """Add contour lines for different terrain types."""
         levels = [self.WATER_LEVEL, self.MOUNTAIN_LEVEL]
-        plt.contour(heightmap, levels=levels, colors='black', alpha=0.3)
+        heights, xs, ys = _downsample(heightmap)
+        plt.contour(xs, ys, heights, levels=levels, colors='black', alpha=0.3)
         
     def _height_distribution(self, heightmap: np.ndarray, ax: plt.Axes, title: str):
         """Plot height distribution histogram."""
-        ax.hist(heightmap.ravel(), bins=50, color='skyblue', alpha=0.7)
+        # Bin with numpy and plot the counts as weights, so matplotlib draws
+        # 50 bars instead of processing every height itself
+        counts, edges = np.histogram(heightmap, bins=50)
+        ax.hist(edges[:-1], bins=edges, weights=counts, color='skyblue', alpha=0.7)
         ax.axvline(self.WATER_LEVEL, color='blue', linestyle='--', alpha=0.5)
         ax.axvline(self.MOUNTAIN_LEVEL, color='brown', linestyle='--', alpha=0.5)
         ax.set_title(title)
@@ -136,18 +153,16 @@ class TerrainVisualizer:
     def _slope_analysis(self, heightmap: np.ndarray, ax: plt.Axes, title: str):
         """Plot terrain slopes."""
         gy, gx = np.gradient(heightmap)
-        slopes = np.sqrt(gx**2 + gy**2)
+        slopes = np.hypot(gx, gy, out=gx)
         im = ax.imshow(slopes, cmap='viridis')
         plt.colorbar(im, ax=ax)
         ax.set_title(title)
         
     def _terrain_types(self, heightmap: np.ndarray, ax: plt.Axes, title: str):
         """Visualize different terrain types."""
-        terrain_types = np.zeros_like(heightmap)
-        terrain_types[heightmap < self.WATER_LEVEL] = 0  # Water
-        terrain_types[(heightmap >= self.WATER_LEVEL) & 
-                     (heightmap < self.MOUNTAIN_LEVEL)] = 1  # Land
-        terrain_types[heightmap >= self.MOUNTAIN_LEVEL] = 2  # Mountains
+        # Water 0, land 1, mountains 2: count the thresholds each height reaches
+        terrain_types = (heightmap >= self.WATER_LEVEL).view(np.uint8)
+        terrain_types += heightmap >= self.MOUNTAIN_LEVEL
         
         im = ax.imshow(terrain_types, cmap='tab10')
         cbar = plt.colorbar(im, ax=ax, ticks=[0, 1, 2])
@@ -157,7 +172,8 @@ class TerrainVisualizer:
     def _erosion_patterns(self, heightmap: np.ndarray, ax: plt.Axes, title: str):
         """Visualize potential erosion patterns."""
         gy, gx = np.gradient(heightmap)
-        erosion = np.abs(gx) + np.abs(gy)
+        erosion = np.abs(gx, out=gx)
+        erosion += np.abs(gy, out=gy)
         im = ax.imshow(erosion, cmap=self.EROSION_CMAP)
         plt.colorbar(im, ax=ax)
         ax.set_title(title)
\ No newline at end of file
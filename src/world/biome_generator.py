@@ -1,25 +1,25 @@
 from dataclasses import dataclass
-from enum import Enum, auto
 import numpy as np
 from typing import Dict, Optional
 from src.utils.configuration_manager import ConfigurationManager
-from scipy.ndimage import distance_transform_edt
+from scipy.ndimage import distance_transform_cdt
 from src.world.biome_type import BiomeType
 
-class BiomeType(Enum):
-	OCEAN = auto()
-	SHALLOW_OCEAN = auto()
-	BEACH = auto()
-	TUNDRA = auto()
-	COLD_DESERT = auto()
-	GRASSLAND = auto()
-	TEMPERATE_FOREST = auto()
-	TEMPERATE_RAINFOREST = auto()
-	SAVANNA = auto()
-	DESERT = auto()
-	TROPICAL_RAINFOREST = auto()
-	MOUNTAIN = auto()
-	SNOW_PEAKS = auto()
+# Biome by [height band, temperature band, precipitation band], flattened.
+# Height bands: ocean, shallow ocean, beach, land, mountain; temperature
+# bands: cold, temperate, warm; precipitation bands: dry, moderate, wet.
+_BIOME_LUT = np.empty((5, 3, 3), dtype=np.int32)
+_BIOME_LUT[0] = BiomeType.OCEAN.value
+_BIOME_LUT[1] = BiomeType.SHALLOW_OCEAN.value
+_BIOME_LUT[2] = BiomeType.BEACH.value
+_BIOME_LUT[3] = [
+	[BiomeType.COLD_DESERT.value, BiomeType.TUNDRA.value, BiomeType.TUNDRA.value],
+	[BiomeType.GRASSLAND.value, BiomeType.TEMPERATE_FOREST.value, BiomeType.TEMPERATE_RAINFOREST.value],
+	[BiomeType.DESERT.value, BiomeType.SAVANNA.value, BiomeType.TROPICAL_RAINFOREST.value],
+]
+_BIOME_LUT[4, 0] = BiomeType.SNOW_PEAKS.value
+_BIOME_LUT[4, 1:] = BiomeType.MOUNTAIN.value
+_BIOME_LUT = _BIOME_LUT.ravel()
 
 @dataclass
 class BiomeSettings:
@@ -36,16 +36,21 @@ class BiomeSettings:
 	@classmethod
 	def from_config(cls, config: dict) -> 'BiomeSettings':
 		biome_config = config.get('world_gen', {}).get('biomes', {})
+		ocean_level = biome_config.get('ocean_level', 0.35)
+		cold_thresh = biome_config.get('cold_thresh', 0.3)
+		dry_thresh = biome_config.get('dry_thresh', 0.3)
+		# assign_biomes counts bands against ordered thresholds, so keep
+		# mountains above the beach and each upper threshold above its lower one
 		return cls(
 			temperature_weight=biome_config.get('temperature_weight', 1.0),
 			precipitation_weight=biome_config.get('precipitation_weight', 1.0),
 			altitude_weight=biome_config.get('altitude_weight', 1.0),
-			ocean_level=biome_config.get('ocean_level', 0.35),
-			mountain_level=biome_config.get('mountain_level', 0.65),
-			cold_thresh=biome_config.get('cold_thresh', 0.3),
-			temperate_thresh=biome_config.get('temperate_thresh', 0.6),
-			dry_thresh=biome_config.get('dry_thresh', 0.3),
-			wet_thresh=biome_config.get('wet_thresh', 0.6)
+			ocean_level=ocean_level,
+			mountain_level=max(biome_config.get('mountain_level', 0.65), ocean_level + 0.05),
+			cold_thresh=cold_thresh,
+			temperate_thresh=max(biome_config.get('temperate_thresh', 0.6), cold_thresh),
+			dry_thresh=dry_thresh,
+			wet_thresh=max(biome_config.get('wet_thresh', 0.6), dry_thresh)
 		)
 
 class BiomeGenerator:
@@ -64,16 +69,16 @@ class BiomeGenerator:
 		# Create more extreme latitude-based temperature gradient
 		y = np.linspace(-1, 1, height)[:, np.newaxis]
 		base_temp = 1.2 - np.power(np.abs(y), 0.75)  # More extreme gradient
-		base_temp = np.tile(base_temp, (1, width))
 		
-		# Add large-scale continental temperature variations
-		x = np.linspace(0, 4*np.pi, width)
-		y = np.linspace(0, 4*np.pi, height)
-		X, Y = np.meshgrid(x, y)
+		# Add large-scale continental temperature variations. The patterns
+		# are separable, so the trig runs once per column and row and the
+		# products broadcast to the full grid
+		x = np.linspace(0, 4*np.pi, width)[np.newaxis, :]
+		y = np.linspace(0, 4*np.pi, height)[:, np.newaxis]
 		
 		# Create larger temperature variation patterns
-		continental = 0.4 * np.sin(X/3) * np.cos(Y/3)
-		regional = 0.2 * np.sin(X) * np.cos(Y)
+		continental = 0.4 * np.sin(x/3) * np.cos(y/3)
+		regional = 0.2 * np.sin(x) * np.cos(y)
 		local = 0.1 * rng.normal(0, 1, (height, width))
 		
 		# Combine all effects with more weight on the base temperature
@@ -93,21 +98,38 @@ class BiomeGenerator:
 		# Find water bodies
 		water_mask = heightmap < self.settings.ocean_level
 		
-		# Calculate distance from water with less weight
-		distance_from_water = distance_transform_edt(~water_mask)
-		distance_from_water = distance_from_water / distance_from_water.max()
+		# Calculate distance from water with less weight. It is normalized and
+		# blurred by noise below, so a 3-4 chamfer approximation stands in for
+		# the exact Euclidean transform: for a nearest-water offset (dx, dy)
+		# with dx >= dy that is dx + dy/3, built from the two cheap integer
+		# transforms
+		if water_mask.any():
+			land = ~water_mask
+			chessboard = distance_transform_cdt(land, metric='chessboard')
+			taxicab = distance_transform_cdt(land, metric='taxicab')
+			distance_from_water = chessboard + (taxicab - chessboard) / 3
+			max_distance = distance_from_water.max()
+			if max_distance > 0:
+				distance_from_water /= max_distance
+		else:
+			# No water at all: every tile is as far from the coast as it
+			# gets, so the coastal term drops out
+			distance_from_water = np.ones((height, width))
 		
 		# Create large-scale precipitation patterns
 		x = np.linspace(0, 6*np.pi, width)
 		y = np.linspace(0, 6*np.pi, height)
-		X, Y = np.meshgrid(x, y)
 		
-		# Create monsoon-like patterns
-		monsoon = 0.5 * (np.sin(X/4) + np.cos(Y/4))
+		# Create monsoon-like patterns; the terms are separable, so the trig
+		# runs once per row and column and broadcasts to the full grid
+		monsoon = 0.5 * (np.sin(x/4)[np.newaxis, :] + np.cos(y/4)[:, np.newaxis])
 		
 		# Add orographic effect (more rain on mountain slopes)
-		slopes = np.abs(np.gradient(heightmap)[0]) + np.abs(np.gradient(heightmap)[1])
-		slopes = slopes / slopes.max()
+		# One gradient pass, with abs, sum and normalization done in place
+		grad_y, grad_x = np.gradient(heightmap)
+		slopes = np.abs(grad_y, out=grad_y)
+		slopes += np.abs(grad_x, out=grad_x)
+		slopes /= slopes.max()
 		
 		# Create rain shadow effect
 		rain_shadow = np.roll(slopes, shift=int(width/8), axis=1)  # Shift effect downwind
@@ -120,123 +142,43 @@ class BiomeGenerator:
 						0.1 * rng.normal(0, 1, (height, width)))  # Local variation
 		
 		# Before power operation, ensure all values are non-negative
-		precipitation = np.clip(precipitation, 0, None)
-		# Now apply power function
-		precipitation = np.power(precipitation, 0.8)
+		np.clip(precipitation, 0, None, out=precipitation)
+		# Apply some non-linear scaling to create more distinct wet/dry
+		# regions; one power of 0.8 * 0.8 rather than two of 0.8
+		np.power(precipitation, 0.64, out=precipitation)
 		
-		# Apply some non-linear scaling to create more distinct wet/dry regions
-		precipitation = np.power(precipitation, 0.8)
-		
-		return np.clip(precipitation, 0, 1)
+		return np.clip(precipitation, 0, 1, out=precipitation)
     
 	def assign_biomes(self, heightmap: np.ndarray, temperature: np.ndarray, 
 						precipitation: np.ndarray) -> np.ndarray:
-		"""Assign biomes based on height, temperature, and precipitation."""
-		height, width = heightmap.shape
-		biome_map = np.zeros((height, width), dtype=np.int32)
-		
-		for y in range(height):
-			for x in range(width):
-				height_val = heightmap[y, x]
-				temp_val = temperature[y, x]
-				precip_val = precipitation[y, x]
-				
-				# Ocean and mountains first
-				if height_val < self.settings.ocean_level:
-					if height_val < self.settings.ocean_level - 0.1:
-						biome_map[y, x] = BiomeType.OCEAN.value
-					else:
-						biome_map[y, x] = BiomeType.SHALLOW_OCEAN.value
-					continue
-				
-				# Beach
-				if height_val < self.settings.ocean_level + 0.05:
-					biome_map[y, x] = BiomeType.BEACH.value
-					continue
-				
-				# Mountains and peaks
-				if height_val > self.settings.mountain_level:
-					if temp_val < self.settings.cold_thresh:
-						biome_map[y, x] = BiomeType.SNOW_PEAKS.value
-					else:
-						biome_map[y, x] = BiomeType.MOUNTAIN.value
-					continue
-				
-				# Other biomes based on temperature and precipitation
-				if temp_val < self.settings.cold_thresh:
-					if precip_val < self.settings.dry_thresh:
-						biome_map[y, x] = BiomeType.COLD_DESERT.value
-					else:
-						biome_map[y, x] = BiomeType.TUNDRA.value
-				elif temp_val < self.settings.temperate_thresh:
-					if precip_val < self.settings.dry_thresh:
-						biome_map[y, x] = BiomeType.GRASSLAND.value
-					elif precip_val < self.settings.wet_thresh:
-						biome_map[y, x] = BiomeType.TEMPERATE_FOREST.value
-					else:
-						biome_map[y, x] = BiomeType.TEMPERATE_RAINFOREST.value
-				else:  # warm
-					if precip_val < self.settings.dry_thresh:
-						biome_map[y, x] = BiomeType.DESERT.value
-					elif precip_val < self.settings.wet_thresh:
-						biome_map[y, x] = BiomeType.SAVANNA.value
-					else:
-						biome_map[y, x] = BiomeType.TROPICAL_RAINFOREST.value
-		
-		return biome_map
-	
-	# def assign_biomes(self, heightmap: np.ndarray, temperature: np.ndarray, 
-	# 					precipitation: np.ndarray) -> np.ndarray:
-	# 	"""Assign biomes based on height, temperature, and precipitation."""
-	# 	height, width = heightmap.shape
-	# 	biome_map = np.zeros((height, width), dtype=np.int32)
-		
-	# 	for y in range(height):
-	# 		for x in range(width):
-	# 			height_val = heightmap[y, x]
-	# 			temp_val = temperature[y, x]
-	# 			precip_val = precipitation[y, x]
-				
-	# 			# Ocean and mountains first
-	# 			if height_val < self.settings.ocean_level:
-	# 				if height_val < self.settings.ocean_level - 0.1:
-	# 					biome_map[y, x] = BiomeType.OCEAN.value
-	# 				else:
-	# 					biome_map[y, x] = BiomeType.SHALLOW_OCEAN.value
-	# 				continue
-				
-	# 			# Beach
-	# 			if height_val < self.settings.ocean_level + 0.05:
-	# 				biome_map[y, x] = BiomeType.BEACH.value
-	# 				continue
-				
-	# 			# Mountains and peaks
-	# 			if height_val > self.settings.mountain_level:
-	# 				if temp_val < self.settings.cold_thresh:
-	# 					biome_map[y, x] = BiomeType.SNOW_PEAKS.value
-	# 				else:
-	# 					biome_map[y, x] = BiomeType.MOUNTAIN.value
-	# 				continue
-				
-	# 			# Other biomes based on temperature and precipitation
-	# 			if temp_val < self.settings.cold_thresh:
-	# 				if precip_val < self.settings.dry_thresh:
-	# 					biome_map[y, x] = BiomeType.COLD_DESERT.value
-	# 				else:
-	# 					biome_map[y, x] = BiomeType.TUNDRA.value
-	# 			elif temp_val < self.settings.temperate_thresh:
-	# 				if precip_val < self.settings.dry_thresh:
-	# 					biome_map[y, x] = BiomeType.GRASSLAND.value
-	# 				elif precip_val < self.settings.wet_thresh:
-	# 					biome_map[y, x] = BiomeType.TEMPERATE_FOREST.value
-	# 				else:
-	# 					biome_map[y, x] = BiomeType.TEMPERATE_RAINFOREST.value
-	# 			else:  # warm
-	# 				if precip_val < self.settings.dry_thresh:
-	# 					biome_map[y, x] = BiomeType.DESERT.value
-	# 				elif precip_val < self.settings.wet_thresh:
-	# 					biome_map[y, x] = BiomeType.SAVANNA.value
-	# 				else:
-	# 					biome_map[y, x] = BiomeType.TROPICAL_RAINFOREST.value
-		
-	# 	return biome_map
\ No newline at end of file
+		"""Assign biomes based on height, temperature, and precipitation.
+		
+		Each cell's bands are counted into a small int8 index (one in-place
+		add per threshold) and looked up in _BIOME_LUT, so no per-rule
+		masks are kept around. Bands are counted down from the top with the
+		same comparisons as a per-cell if/elif cascade, so NaN values land
+		in the same band; this relies on the threshold order that
+		BiomeSettings.from_config enforces.
+		"""
+		s = self.settings
+		
+		# Height band: ocean, shallow ocean, beach, land or mountain
+		index = (heightmap > s.mountain_level).view(np.int8)
+		index += 3
+		index -= heightmap < s.ocean_level + 0.05
+		index -= heightmap < s.ocean_level
+		index -= heightmap < s.ocean_level - 0.1
+		
+		# Temperature band: cold, temperate or warm
+		index *= 3
+		index += 2
+		index -= temperature < s.cold_thresh
+		index -= temperature < s.temperate_thresh
+		
+		# Precipitation band: dry, moderate or wet
+		index *= 3
+		index += 2
+		index -= precipitation < s.dry_thresh
+		index -= precipitation < s.wet_thresh
+		
+		return _BIOME_LUT[index]
@@ -36,6 +36,9 @@ class TerrainSymbols:
     FRAME_VERTICAL = '│'
 
 class MapRenderer:
+    # Lower bounds of the height bands get_terrain_symbol falls back to
+    HEIGHT_BANDS = (0.2, 0.35, 0.4, 0.6, 0.75, 0.85)
+
     def __init__(self):
         self.symbols = TerrainSymbols()
         # Add blocking terrain types
@@ -44,6 +47,13 @@ class MapRenderer:
             self.symbols.PEAKS,
             self.symbols.FOREST
         }
+        self._blocking_codes = np.array([ord(symbol) for symbol in self.BLOCKING_TERRAIN], dtype=np.int32)
+        # Terrain code points by biome ID, and by height band for maps without biomes
+        self._biome_codes = np.zeros(max(biome.value for biome in BiomeType) + 1, dtype=np.int32)
+        for biome in BiomeType:
+            self._biome_codes[biome.value] = ord(self.get_terrain_symbol(0.0, biome))
+        self._height_codes = np.array([ord(self.get_terrain_symbol(height))
+                                       for height in (0.0,) + self.HEIGHT_BANDS], dtype=np.int32)
         
     def get_terrain_symbol(self, height: float, biome_type: Optional[BiomeType] = None) -> str:
         """Convert height and biome data into an ASCII symbol."""
@@ -88,8 +98,15 @@ class MapRenderer:
 
     def render_world_map(self, world_data: Dict, width: int, height: int, 
                         discovery_mask: Optional[np.ndarray] = None,
-                        player = None) -> tuple[list[list[str]], dict]:
+                        player = None) -> tuple[list[list[str]], np.ndarray]:
         """Render the world map at the specified dimensions."""
+        ch, biome_info = self.render_world_codes(world_data, width, height, discovery_mask, player)
+        return self._to_symbols(ch), biome_info
+
+    def render_world_codes(self, world_data: Dict, width: int, height: int, 
+                           discovery_mask: Optional[np.ndarray] = None,
+                           player = None) -> tuple[np.ndarray, np.ndarray]:
+        """Render the world map as a [y, x] array of symbol code points."""
         heightmap = world_data['heightmap']
         biome_map = world_data.get('biome_map')
         settlements = world_data.get('settlements', [])
@@ -99,16 +116,16 @@ class MapRenderer:
         x_ratio = heightmap.shape[1] / width
         zoom_level = max(y_ratio, x_ratio)  # Higher ratio means more zoomed out
         
-        # Initialize the ASCII map and biome info
-        ascii_map = [['' for _ in range(width)] for _ in range(height)]
-        biome_info = {}  # Store biome info for each position
+        # Initialize the map and biome info
+        ch = np.zeros((height, width), dtype=np.int32)
+        biome_info = np.full((height, width), -1, dtype=np.int8)  # Biome ID per position, -1 if none
         metadata = {}  # Store settlement metadata
         
         for y in range(height):
             for x in range(width):
                 # Skip if not discovered and discovery_mask is provided
                 if discovery_mask is not None and not discovery_mask[y, x]:
-                    ascii_map[y][x] = self.symbols.UNKNOWN
+                    ch[y, x] = ord(self.symbols.UNKNOWN)
                     continue
                 
                 # Calculate the region of original map this pixel represents
@@ -124,11 +141,11 @@ class MapRenderer:
                     dominant_biome = unique_biomes[np.argmax(counts)]
                     height_val = np.mean(heightmap[y_start:y_end, x_start:x_end])
                     biome_type = BiomeType(dominant_biome)
-                    ascii_map[y][x] = self.get_terrain_symbol(height_val, biome_type)
-                    biome_info[f"{y},{x}"] = biome_type
+                    ch[y, x] = ord(self.get_terrain_symbol(height_val, biome_type))
+                    biome_info[y, x] = biome_type.value
                 else:
                     height_val = np.mean(heightmap[y_start:y_end, x_start:x_end])
-                    ascii_map[y][x] = self.get_terrain_symbol(height_val)
+                    ch[y, x] = ord(self.get_terrain_symbol(height_val))
         
         # Add settlements on top of terrain, sorted by importance
         if settlements:
@@ -167,7 +184,7 @@ class MapRenderer:
                 if 0 <= map_y < height and 0 <= map_x < width:
                     # Get the appropriate symbol based on settlement type
                     symbol = getattr(self.symbols, settlement.type.name)
-                    ascii_map[map_y][map_x] = symbol
+                    ch[map_y, map_x] = ord(symbol)
         
         # Add player character on top of everything else if provided
         if player is not None:
@@ -177,14 +194,26 @@ class MapRenderer:
             
             # Ensure position is within bounds
             if 0 <= map_y < height and 0 <= map_x < width:
-                ascii_map[map_y][map_x] = player.char
+                ch[map_y, map_x] = ord(player.char)
         
-        return ascii_map, biome_info
+        return ch, biome_info
 
     def render_local_map(self, world_data: Dict, 
                         center_pos: Tuple[int, int], 
-                        view_width: int, view_height: int) -> tuple[list[list[str]], dict]:
+                        view_width: int, view_height: int) -> tuple[list[list[str]], np.ndarray]:
         """Render a local area map centered on the given position."""
+        ch, biome_info = self.render_local_codes(world_data, center_pos, view_width, view_height)
+        return self._to_symbols(ch), biome_info
+
+    def render_local_codes(self, world_data: Dict, 
+                           center_pos: Tuple[int, int], 
+                           view_width: int, view_height: int,
+                           out: Optional[Tuple[np.ndarray, np.ndarray]] = None) -> tuple[np.ndarray, np.ndarray]:
+        """Render a local area map as a [y, x] array of symbol code points.
+        
+        Pass (code point, biome ID) arrays of the view's shape as out to
+        render into them instead of allocating new ones.
+        """
         heightmap = world_data['heightmap']
         biome_map = world_data.get('biome_map')
         settlements = world_data.get('settlements', [])
@@ -193,48 +222,57 @@ class MapRenderer:
         y_center, x_center = center_pos
         half_height = view_height // 2
         half_width = view_width // 2
+        top = y_center - half_height
+        left = x_center - half_width
         
-        # Initialize the ASCII map with UNKNOWN symbols
-        ascii_map = [[self.symbols.UNKNOWN for _ in range(view_width)] 
-                    for _ in range(view_height)]
-        biome_info = {}  # Store biome info for each position
+        # Initialize the map with UNKNOWN symbols
+        if out is None:
+            ch = np.empty((view_height, view_width), dtype=np.int32)
+            biome_info = np.empty((view_height, view_width), dtype=np.int8)
+        else:
+            ch, biome_info = out
+        ch[...] = ord(self.symbols.UNKNOWN)
+        biome_info[...] = -1  # Biome ID per position, -1 if none
         
-        # Fill in the visible area
-        for view_y in range(view_height):
-            world_y = y_center - half_height + view_y
-            if 0 <= world_y < heightmap.shape[0]:  # Only process if within world bounds
-                for view_x in range(view_width):
-                    world_x = x_center - half_width + view_x
-                    if 0 <= world_x < heightmap.shape[1]:  # Only process if within world bounds
-                        height_val = heightmap[world_y, world_x]
-                        if biome_map is not None:
-                            biome_type = BiomeType(biome_map[world_y, world_x])
-                            ascii_map[view_y][view_x] = self.get_terrain_symbol(height_val, biome_type)
-                            biome_info[f"{view_y},{view_x}"] = biome_type
-                        else:
-                            ascii_map[view_y][view_x] = self.get_terrain_symbol(height_val)
+        # Fill in the part of the view that lies within world bounds
+        world_y0, world_y1 = max(top, 0), min(top + view_height, heightmap.shape[0])
+        world_x0, world_x1 = max(left, 0), min(left + view_width, heightmap.shape[1])
+        if world_y0 < world_y1 and world_x0 < world_x1:
+            view = (slice(world_y0 - top, world_y1 - top), slice(world_x0 - left, world_x1 - left))
+            world = (slice(world_y0, world_y1), slice(world_x0, world_x1))
+            if biome_map is not None:
+                biomes = biome_map[world]
+                ch[view] = self._biome_codes[biomes]
+                biome_info[view] = biomes
+            else:
+                ch[view] = self._height_codes[np.searchsorted(self.HEIGHT_BANDS, heightmap[world], side='right')]
         
         # Add settlements that are within view
         for settlement in settlements:
             # Convert settlement position to view coordinates
-            view_y = settlement.position[0] - (y_center - half_height)
-            view_x = settlement.position[1] - (x_center - half_width)
+            view_y = settlement.position[0] - top
+            view_x = settlement.position[1] - left
             
             # Only draw if within view bounds
             if 0 <= view_y < view_height and 0 <= view_x < view_width:
                 # Only draw if the settlement is in valid world coordinates
-                world_y = y_center - half_height + view_y
-                world_x = x_center - half_width + view_x
+                world_y = top + view_y
+                world_x = left + view_x
                 if 0 <= world_y < heightmap.shape[0] and 0 <= world_x < heightmap.shape[1]:
                     symbol = getattr(self.symbols, settlement.type.name)
-                    ascii_map[view_y][view_x] = symbol
+                    ch[view_y, view_x] = ord(symbol)
         
         # Place player at center (on top of everything else)
         center_y = view_height // 2
         center_x = view_width // 2
-        ascii_map[center_y][center_x] = '@'
+        ch[center_y, center_x] = ord('@')
         
-        return ascii_map, biome_info
+        return ch, biome_info
+
+    @staticmethod
+    def _to_symbols(ch: np.ndarray) -> list[list[str]]:
+        """Convert a code point array to rows of symbols."""
+        return [list(map(chr, row)) for row in ch.tolist()]
 
     def add_frame(self, ascii_map: list[list[str]]) -> list[list[str]]:
         """Add a frame around the ASCII map."""
@@ -283,10 +321,19 @@ class MapRenderer:
 
     def calculate_los(self, ascii_map: list[list[str]], center_pos: Tuple[int, int], 
                      view_height: int, view_width: int, radius: int = 30) -> Set[Tuple[int, int]]:
-        """Calculate visible positions from the center position.
+        """Calculate the set of (y, x) positions visible from the center position.
+        
+        See calculate_los_mask for the arguments.
+        """
+        mask = self.calculate_los_mask(ascii_map, center_pos, view_height, view_width, radius)
+        return set(map(tuple, np.argwhere(mask).tolist()))
+
+    def calculate_los_mask(self, ascii_map: list[list[str]], center_pos: Tuple[int, int], 
+                           view_height: int, view_width: int, radius: int = 30) -> np.ndarray:
+        """Calculate a boolean [y, x] mask of positions visible from the center position.
         
         Args:
-            ascii_map: The map to calculate visibility for
+            ascii_map: The map to calculate visibility for, as rows of symbols or a code point array
             center_pos: The center position (y,x) to calculate visibility from
             view_height: Height of the view
             view_width: Width of the view
@@ -296,26 +343,20 @@ class MapRenderer:
         map_height = len(ascii_map)
         map_width = len(ascii_map[0]) if map_height > 0 else 0
         
-        # Create a TCOD map for FOV calculations
-        tcod_map = tcod.map.Map(map_width, map_height)
-        
-        # Set walkable and transparent properties based on terrain
-        for y in range(map_height):
-            for x in range(map_width):
-                symbol = ascii_map[y][x]
-                is_blocking = symbol in self.BLOCKING_TERRAIN
-                # All tiles are walkable for FOV, but some block visibility
-                tcod_map.transparent[y, x] = not is_blocking
-                tcod_map.walkable[y, x] = True
+        # Only forests and mountains block visibility
+        transparent = np.zeros((map_height, map_width), dtype=bool)
+        if map_height and map_width:
+            symbols = np.asarray(ascii_map)
+            if symbols.dtype.kind in 'iu':
+                transparent[...] = ~np.isin(symbols, self._blocking_codes)
+            else:
+                transparent[...] = ~np.isin(symbols, list(self.BLOCKING_TERRAIN))
         
         # HACK: modifying center_pos by 4/-4 works. One day we'll work out why. Now it just does.
-        tcod_map.compute_fov(center_pos[0]+4, center_pos[1]-4, radius=radius, algorithm=tcod.FOV_SHADOW)
-        
-        # Get visible positions
-        visible_positions = set()
-        for y in range(map_height):
-            for x in range(map_width):
-                if tcod_map.fov[y, x]:
-                    visible_positions.add((y, x))
+        pov_y, pov_x = center_pos[1] - 4, center_pos[0] + 4
+        if not (0 <= pov_y < map_height and 0 <= pov_x < map_width):
+            # Nothing is visible from outside the map
+            return np.zeros((map_height, map_width), dtype=bool)
         
-        return visible_positions
\ No newline at end of file
+        # Visibility as a [y, x] boolean mask
+        return tcod.map.compute_fov(transparent, (pov_y, pov_x), radius=radius, algorithm=tcod.FOV_SHADOW)
\ No newline at end of file
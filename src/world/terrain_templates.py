@@ -4,6 +4,10 @@ import yaml
 from typing import Dict, Optional
 from src.world.terrain_settings import TerrainSettings, ErosionSettings
 
+# Use libyaml's faster C loader and emitter when PyYAML was built with them
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 @dataclass
 class TerrainTemplate:
     name: str
@@ -42,7 +46,7 @@ class TerrainTemplateManager:
 		try:
 			file_path = self.templates_dir / f"{name.lower().replace(' ', '_')}.yaml"
 			with open(file_path, 'w') as f:
-				yaml.dump(template_dict, f, default_flow_style=False)
+				yaml.dump(template_dict, f, Dumper=_YAML_DUMPER, default_flow_style=False)
 			self.templates[name] = template
 			return True
 		except Exception as e:
@@ -54,7 +58,7 @@ class TerrainTemplateManager:
 		for template_file in self.templates_dir.glob("*.yaml"):
 			try:
 				with open(template_file, 'r') as f:
-					template_dict = yaml.safe_load(f)
+					template_dict = yaml.load(f, Loader=_YAML_LOADER)
 				
 				# Create erosion settings if present
 				erosion_dict = template_dict['settings'].get('erosion')
@@ -0,0 +1,14 @@
+import numpy as np
+from src.utils.color_maps import height_to_color, heightmap_to_rgb
+
+def test_heightmap_to_rgb_matches_height_to_color():
+    """Test that the vectorized colors match the scalar ones, band edges included."""
+    heights = np.array([[0.0, 0.29, 0.3, 0.39, 0.4],
+                        [0.49, 0.5, 0.69, 0.7, 1.0]])
+
+    colors = heightmap_to_rgb(heights)
+
+    assert colors.shape == (2, 5, 3)
+    assert colors.dtype == np.uint8
+    for (y, x), height in np.ndenumerate(heights):
+        assert tuple(colors[y, x]) == height_to_color(height)
@@ -0,0 +1,40 @@
+import pytest
+import yaml
+from src.utils.configuration_manager import ConfigurationManager
+
+def test_defaults_are_not_shared(tmp_path):
+    """Test that editing a fresh config leaves the defaults untouched."""
+    config_manager = ConfigurationManager(config_dir=tmp_path)
+    config_manager.config["keybindings"]["move_up"].append("w")
+    config_manager.config["debug"]["enabled"] = True
+
+    assert ConfigurationManager.DEFAULT_CONFIG["keybindings"]["move_up"] == ["UP", "k"]
+    assert ConfigurationManager.DEFAULT_CONFIG["debug"]["enabled"] is False
+    with pytest.raises(TypeError):
+        ConfigurationManager.DEFAULT_CONFIG["debug"]["enabled"] = True
+
+def test_missing_values_filled_at_load(tmp_path):
+    """Test that a partial config file is completed from the defaults once, at load."""
+    with open(tmp_path / "config.yaml", "w") as f:
+        yaml.safe_dump({"performance": {"target_fps": 30, "logging_interval": 300}}, f)
+
+    config_manager = ConfigurationManager(config_dir=tmp_path)
+    perf = config_manager.get_performance_config()
+
+    assert perf.target_fps == 30
+    assert perf.log_interval == 300
+    assert perf.max_messages == 100
+    assert config_manager.get_display_config().screen_width == 80
+    assert "logging_interval" not in config_manager.config["performance"]
+
+def test_config_objects_cached_until_config_changes(tmp_path):
+    """Test that getters return the same object until the config is updated."""
+    from src.utils.configuration_manager import ConfigScope
+    config_manager = ConfigurationManager(config_dir=tmp_path)
+    display = config_manager.get_display_config()
+
+    assert config_manager.get_display_config() is display
+
+    config_manager.update_config(ConfigScope.DEBUG, {"enabled": True})
+    assert config_manager.get_display_config() is not display
+    assert config_manager.get_display_config() == display
@@ -103,3 +103,96 @@ def test_console_dimensions(display_manager):
                                 DisplayManager.MINIMAP_HEIGHT - 
                                 DisplayManager.STATUS_HEIGHT)
     assert message_log.width == DisplayManager.SIDEBAR_WIDTH
+
+def test_consoles_share_root_buffer(display_manager):
+    """Test that console layers write straight into the root console."""
+    status_y = DisplayManager.SCREEN_HEIGHT - DisplayManager.STATUS_HEIGHT
+    sidebar_x = DisplayManager.SCREEN_WIDTH - DisplayManager.SIDEBAR_WIDTH
+    
+    display_manager.get_console("status").print(2, 1, "Hi", fg=(255, 0, 0))
+    assert chr(display_manager.root_console.ch[status_y + 1, 2]) == "H"
+    assert display_manager.root_console.fg[status_y + 1, 2].tolist() == [255, 0, 0]
+    
+    # Text is clipped to the layer instead of spilling into its neighbour
+    main_console = display_manager.get_console("main")
+    main_console.print(main_console.width - 2, 0, "ABCD")
+    assert chr(display_manager.root_console.ch[0, sidebar_x - 1]) == "B"
+    assert chr(display_manager.root_console.ch[0, sidebar_x]) != "C"
+
+def test_print_at_marks_dirty(display_manager):
+    """Test that print_at marks its console dirty until the next render."""
+    display_manager.render()
+    assert not display_manager._dirty
+    
+    display_manager.print_at("status", 2, 1, "Hi")
+    assert display_manager._dirty == {"status"}
+    
+    display_manager.render()
+    assert not display_manager._dirty
+
+def test_set_vsync(display_manager):
+    """Test that vsync can be toggled without losing the consoles."""
+    consoles = dict(display_manager.consoles)
+    
+    display_manager.set_vsync(False)
+    assert display_manager.vsync is False
+    display_manager.set_vsync(True)
+    assert display_manager.vsync is True
+    
+    assert display_manager.consoles == consoles
+    display_manager.render()
+
+def test_reload_config_reuses_consoles(display_manager):
+    """Test that reloading the config recreates the context but keeps the consoles."""
+    root_console = display_manager.root_console
+    consoles = dict(display_manager.consoles)
+    context = display_manager.context
+    
+    display_manager.reload_config()
+    
+    assert display_manager.context is not context
+    assert display_manager.root_console is root_console
+    assert display_manager.consoles == consoles
+    display_manager.render()
+
+def test_render_skips_unchanged_frames(display_manager, monkeypatch):
+    """Test that nothing is presented unless a console changed."""
+    presented = []
+    monkeypatch.setattr(display_manager.context, "present", lambda console: presented.append(console))
+    
+    display_manager.render()
+    display_manager.render()
+    assert len(presented) == 1
+    
+    display_manager.print_at("status", 0, 0, "Changed")
+    display_manager.render()
+    display_manager.mark_all_dirty()
+    display_manager.render()
+    assert len(presented) == 3
+
+def test_context_manager_closes_on_error(display_manager, monkeypatch):
+    """Test that leaving a with block closes the display and re-raises errors."""
+    closed = []
+    monkeypatch.setattr(display_manager, "close", lambda: closed.append(True))
+    
+    with pytest.raises(RuntimeError):
+        with display_manager as dm:
+            assert dm is display_manager
+            raise RuntimeError("boom")
+    assert closed == [True]
+
+def test_console_view_clips_drawing(display_manager):
+    """Test that frames and rects stay inside their layer, and only left alignment is accepted."""
+    sidebar_x = DisplayManager.SCREEN_WIDTH - DisplayManager.SIDEBAR_WIDTH
+    root = display_manager.root_console
+    main_console = display_manager.get_console("main")
+    before = root.rgb[:, sidebar_x:].copy()
+    
+    main_console.draw_frame(main_console.width - 3, 0, 6, 4)
+    main_console.draw_rect(main_console.width - 2, 5, 6, 2, ch=ord("#"))
+    
+    assert (root.rgb[:, sidebar_x:] == before).all()
+    assert chr(root.ch[0, sidebar_x - 3]) == "┌"
+    assert chr(root.ch[5, sidebar_x - 1]) == "#"
+    with pytest.raises(ValueError):
+        main_console.print(0, 0, "Centred", alignment=tcod.constants.CENTER)
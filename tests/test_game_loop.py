@@ -74,6 +74,7 @@ def test_handle_start_game_action(game_loop):
 def test_handle_movement_action(game_loop):
     """Test that movement actions are handled correctly."""
     # First set the game state to GAME_WORLD since movement only works in that state
+    game_loop._ensure_world()
     game_loop.state_manager.change_state(GameState.GAME_WORLD)
     
     # Create a movement action
@@ -96,6 +97,7 @@ def test_handle_movement_action(game_loop):
 def test_handle_sprint_movement(game_loop):
     """Test that sprint movement is handled correctly."""
     # Set game state to GAME_WORLD first
+    game_loop._ensure_world()
     game_loop.state_manager.change_state(GameState.GAME_WORLD)
     
     # Create a sprint movement action
@@ -157,4 +159,55 @@ def test_movement_direction_helper(game_loop):
     assert game_loop._get_movement_direction(-1, -1) == "northwest"
     assert game_loop._get_movement_direction(1, -1) == "northeast"
     assert game_loop._get_movement_direction(-1, 1) == "southwest"
-    assert game_loop._get_movement_direction(1, 1) == "southeast" 
\ No newline at end of file
+    assert game_loop._get_movement_direction(1, 1) == "southeast" 
+
+def test_actions_mark_frame_dirty(game_loop):
+    """Test that handled actions flag the next frame for rendering."""
+    game_loop._frame_dirty = False
+    game_loop.handle_action(None)
+    assert game_loop._frame_dirty is False
+    
+    game_loop.handle_action(GameAction("start_game"))
+    assert game_loop._frame_dirty is True
+
+def test_world_generated_in_background(game_loop):
+    """Test that the background-generated world is swapped in on demand."""
+    game_loop._ensure_world()
+    assert game_loop._world_future is None
+    assert game_loop.player is not None
+    assert game_loop.ui_manager.world_data is not None
+    assert game_loop.ui_manager.player is game_loop.player
+
+def test_movement_ignored_while_world_generates(game_loop):
+    """Test that moves before the world is ready are dropped instead of blocking."""
+    from concurrent.futures import Future
+    game_loop._world_future = Future()
+    game_loop.state_manager.change_state(GameState.GAME_WORLD)
+    
+    assert game_loop.handle_action(GameAction("move", {"dx": 1, "dy": 0})) is True
+    assert game_loop.player is None
+    assert not any("Moving" in msg[0] for msg in game_loop.message_manager.messages)
+
+def test_frame_rate_from_config(game_loop):
+    """Test that frames are paced at the configured target FPS."""
+    from src.utils.configuration_manager import ConfigurationManager
+    target_fps = ConfigurationManager.get_instance().get_performance_config().target_fps
+    assert game_loop.target_fps == target_fps
+    assert game_loop._frame_ns == 1_000_000_000 // target_fps
+
+def test_main_menu_waits_for_input(game_loop, monkeypatch):
+    """Test that an idle main menu blocks on input instead of polling per frame."""
+    game_loop._ensure_world()
+    game_loop._frame_dirty = False
+    timeouts = []
+    
+    def fake_wait(timeout=None):
+        timeouts.append(timeout)
+        return ["quit"]
+    
+    monkeypatch.setattr(tcod.event, "wait", fake_wait)
+    monkeypatch.setattr(tcod.event, "get", lambda: iter(()))
+    monkeypatch.setattr(game_loop.input_handler, "process_event", lambda event: GameAction("quit"))
+    game_loop.run()
+    
+    assert timeouts == [None]
@@ -193,4 +193,74 @@ def test_character_screen_key(input_handler, game_state_manager):
         game_state_manager.change_state(GameState.CHARACTER_SCREEN)
     
     # Verify state changed
-    assert game_state_manager.get_current_state() == GameState.CHARACTER_SCREEN
\ No newline at end of file
+    assert game_state_manager.get_current_state() == GameState.CHARACTER_SCREEN
+
+def test_keys_resolved_per_state(input_handler, game_state_manager):
+    """Test that the same key maps to different handling in each state."""
+    game_state_manager.change_state(GameState.MAIN_MENU)
+    event = tcod.event.KeyDown(
+        sym=tcod.event.KeySym.UP,
+        mod=tcod.event.KMOD_NONE,
+        scancode=0,
+        repeat=False
+    )
+    assert input_handler.dispatch(event) is None
+    
+    game_state_manager.change_state(GameState.INVENTORY)
+    event = tcod.event.KeyDown(
+        sym=tcod.event.KeySym.i,
+        mod=tcod.event.KMOD_NONE,
+        scancode=0,
+        repeat=False
+    )
+    action = input_handler.dispatch(event)
+    
+    assert action.action_type == "close_inventory"
+    assert game_state_manager.get_current_state() == GameState.GAME_WORLD
+
+def test_sprint_does_not_stick(input_handler, game_state_manager):
+    """Test that a sprint move doesn't leave later moves sprinting."""
+    game_state_manager.change_state(GameState.GAME_WORLD)
+    
+    for mod in (tcod.event.KMOD_SHIFT, tcod.event.KMOD_NONE):
+        event = tcod.event.KeyDown(
+            sym=tcod.event.KeySym.UP,
+            mod=mod,
+            scancode=0,
+            repeat=False
+        )
+        action = input_handler.dispatch(event)
+    
+    assert "sprint" not in action.params
+    assert "sprint" not in input_handler.MOVEMENT_KEYS[tcod.event.KeySym.UP].params
+
+def test_actions_are_shared_and_immutable(input_handler, game_state_manager):
+    """Test that repeated key presses return the same immutable action."""
+    game_state_manager.change_state(GameState.GAME_WORLD)
+    event = tcod.event.KeyDown(
+        sym=tcod.event.KeySym.UP,
+        mod=tcod.event.KMOD_NONE,
+        scancode=0,
+        repeat=False
+    )
+    action = input_handler.dispatch(event)
+    
+    assert input_handler.dispatch(event) is action
+    with pytest.raises(TypeError):
+        action.params["sprint"] = True
+
+def test_key_action_map(tmp_path):
+    """Test that the key action map is cached until the config is reloaded."""
+    config_manager = ConfigurationManager(config_dir=tmp_path)
+    key_map = config_manager.get_key_action_map()
+
+    assert key_map["UP"] == key_map["k"] == "move_up"
+    assert config_manager.get_key_action_map() is key_map
+
+    bindings = config_manager.config["keybindings"]
+    config_manager.config["keybindings"] = {**bindings, "move_up": ["w"]}
+    config_manager.save_config()
+    config_manager.load_config()
+    key_map = config_manager.get_key_action_map()
+    assert key_map["w"] == "move_up"
+    assert "UP" not in key_map
@@ -2,6 +2,7 @@ import pytest
 import numpy as np
 from src.world.map_renderer import MapRenderer, TerrainSymbols
 from src.world.biome_generator import BiomeType
+from src.world import biome_type
 
 @pytest.fixture
 def map_renderer():
@@ -200,4 +201,48 @@ def test_calculate_los_with_mismatched_dimensions(map_renderer):
     
     # Positions outside map bounds should not be included
     assert (4, 4) not in visible_positions
-    assert (3, 3) not in visible_positions 
\ No newline at end of file
+    assert (3, 3) not in visible_positions 
+
+def test_calculate_los_mask(map_renderer):
+    """Test that the LOS mask covers the map and agrees with calculate_los."""
+    ascii_map = [
+        ['.', '.', '♠', '.', '.'],
+        ['.', '.', '.', '.', '.'],
+        ['.', '.', '@', '.', '▲'],
+        ['.', '.', '.', '.', '.'],
+        ['.', '♠', '.', '.', '.']
+    ]
+    
+    mask = map_renderer.calculate_los_mask(ascii_map, (2, 2), 5, 5)
+    
+    assert mask.shape == (5, 5)
+    assert mask.dtype == bool
+    assert {tuple(p) for p in np.argwhere(mask).tolist()} == map_renderer.calculate_los(ascii_map, (2, 2), 5, 5)
+
+def test_render_local_codes(map_renderer, sample_world_data):
+    """Test that the local map renders straight to code points."""
+    ch, biome_info = map_renderer.render_local_codes(sample_world_data, (25, 25), 10, 10)
+    
+    assert ch.shape == (10, 10)
+    assert ch[5, 5] == ord('@')
+    assert ch[0, 0] == ord(map_renderer.symbols.PLAINS)
+    assert (biome_info == -1).all()
+    
+    # Off the edge of the world is unknown
+    ch, _ = map_renderer.render_local_codes(sample_world_data, (0, 0), 10, 10)
+    assert ch[0, 0] == ord(map_renderer.symbols.UNKNOWN)
+
+def test_render_local_codes_with_biomes(map_renderer, sample_world_data):
+    """Test that biomes pick the symbols and are reported by ID."""
+    biome_map = np.full((50, 50), BiomeType.GRASSLAND.value)
+    biome_map[:, 30:] = BiomeType.TEMPERATE_FOREST.value
+    world_data = dict(sample_world_data, biome_map=biome_map)
+    
+    ch, biome_info = map_renderer.render_local_codes(world_data, (25, 30), 4, 4)
+    
+    assert [chr(c) for c in ch[0]] == ['.', '.', '♠', '♠']
+    assert biome_info[0].tolist() == [BiomeType.GRASSLAND.value] * 2 + [BiomeType.TEMPERATE_FOREST.value] * 2
+
+def test_biome_type_is_shared():
+    """Test that the generator uses the same BiomeType as the rest of the game."""
+    assert BiomeType is biome_type.BiomeType
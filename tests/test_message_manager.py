@@ -9,7 +9,7 @@ def message_manager():
 def test_message_manager_initialization():
     """Test that MessageManager initializes with correct default values."""
     manager = MessageManager()
-    assert manager.messages == []
+    assert len(manager.messages) == 0
     assert manager.max_messages == 100
     
     # Test custom max_messages
@@ -94,6 +94,15 @@ def test_multiline_message_wrapping():
     # Each paragraph should be wrapped separately
     assert len(manager.messages) >= 3
 
+def test_wrapping_collapses_whitespace():
+    """Test that wrapped lines join words with single spaces, as before textwrap."""
+    manager = MessageManager()
+    
+    manager.add_message("aaaa  bbbb cccc  dddd\teeee", width=14)
+    
+    # Wrapping width is the console width less the 4-cell margin
+    assert [msg[0] for msg in manager.messages] == ["aaaa bbbb", "cccc dddd", "eeee"]
+
 def test_special_characters():
     """Test handling of special characters in messages."""
     manager = MessageManager()
@@ -132,4 +141,25 @@ def test_message_frame_boundaries(message_manager):
     # Verify no messages are written on borders
     for x in range(console.width):
         assert console.ch[0, x] != ord(" ")  # Top border intact
-        assert console.ch[console.height-1, x] != ord(" ")  # Bottom border intact
\ No newline at end of file
+        assert console.ch[console.height-1, x] != ord(" ")  # Bottom border intact
+
+def test_render_after_eviction():
+    """Test that rendering stays in step with the history once old lines are dropped."""
+    manager = MessageManager(max_messages=2)
+    console = tcod.console.Console(width=30, height=10)
+    
+    for msg in ["First", "Second", "Third"]:
+        manager.add_message(msg)
+    manager.render_messages(console)
+    
+    assert chr(console.ch[console.height - 2, 2]) == "T"
+    assert chr(console.ch[console.height - 3, 2]) == "S"
+    assert console.ch[console.height - 4, 2] == ord(" ")
+
+def test_bulk_add():
+    """Test that bulk-added messages land in order as a single log change."""
+    manager = MessageManager()
+    manager.bulk_add([("Welcome!", (255, 223, 0)), ("A cool breeze blows.", (128, 192, 255))])
+    
+    assert manager.revision == 1
+    assert list(manager.messages) == [("Welcome!", (255, 223, 0)), ("A cool breeze blows.", (128, 192, 255))]
@@ -0,0 +1,101 @@
+import numpy as np
+import pytest
+from src.utils.performance_monitor import PerformanceMonitor
+
+@pytest.fixture
+def monitor(tmp_path, monkeypatch):
+    # The monitor logs to ./logs
+    monkeypatch.chdir(tmp_path)
+    return PerformanceMonitor(window_size=4, log_interval=1000)
+
+def test_recent_frames_wrap_around(monitor):
+    """Test that the frame ring buffer keeps the newest frames in order."""
+    for _ in range(6):
+        monitor.start_frame()
+        monitor.end_frame()
+    
+    timestamps, frame_times = monitor._recent_frames()
+    
+    assert len(timestamps) == len(frame_times) == 4
+    assert np.all(np.diff(timestamps) >= 0)
+    assert timestamps[-1] == monitor._timestamps[monitor._next - 1]
+    assert monitor.frame_count == 6
+
+def test_performance_summary(monitor):
+    """Test that the summary reports FPS and the latest frame time."""
+    assert monitor.get_performance_summary()["fps"] == 0.0
+    
+    monitor.start_frame()
+    monitor.end_frame()
+    summary = monitor.get_performance_summary()
+    
+    assert summary["fps"] > 0
+    assert summary["frame_time"] == monitor._frame_times[0]
+    assert summary["memory_usage"] > 0
+
+def test_memory_usage_cached(monitor, monkeypatch):
+    """Test that memory is re-read from the OS at most once a second."""
+    reads = []
+    rss_bytes = monitor._rss_bytes
+    monkeypatch.setattr(monitor, "_rss_bytes", lambda: reads.append(1) or rss_bytes())
+    
+    first = monitor._memory_usage_mb(100.0)
+    assert monitor._memory_usage_mb(100.5) == first
+    assert len(reads) == 1
+    
+    monitor._memory_usage_mb(101.0)
+    assert len(reads) == 2
+
+def test_rss_matches_psutil(monitor):
+    """Test that the resident memory reading agrees with psutil's."""
+    assert monitor._rss_bytes() == pytest.approx(monitor.process.memory_info().rss, rel=0.05)
+
+def test_log_writes_buffered_until_warning(monitor, tmp_path):
+    """Test that info records are held back until a warning flushes them."""
+    from src.utils import performance_monitor
+    # Logging every 5s buffers several records
+    monitor = PerformanceMonitor(log_interval=5)
+    listener = performance_monitor._log_listener
+    log_path = tmp_path / "logs" / "performance.log"
+    
+    def written():
+        # Stopping the listener drains the queue into the buffered handler
+        listener.stop()
+        listener.start()
+        return [line.split(" - ")[-1] for line in log_path.read_text().splitlines()]
+    
+    monitor.perf_logger.info("interval stats")
+    assert "interval stats" not in written()
+    
+    monitor.perf_logger.warning("low fps")
+    assert written()[-2:] == ["interval stats", "low fps"]
+
+def test_idle_frames_not_flagged(monitor, monkeypatch):
+    """Test that rendering rarely but quickly, as when idle, logs below WARNING."""
+    levels = []
+    for name in ("info", "warning", "error"):
+        monkeypatch.setattr(monitor.perf_logger, name, lambda msg, name=name: levels.append(name))
+    
+    # Two fast frames half a second apart: 2 rendered per second
+    times = iter([10.0, 10.001, 10.5, 10.501, 10.501])
+    monkeypatch.setattr("time.perf_counter", lambda: next(times))
+    for _ in range(2):
+        monitor.start_frame()
+        monitor.end_frame()
+    monitor._log_performance_data()
+    
+    assert levels == ["info"]
+
+def test_slow_frames_flagged(monitor, monkeypatch):
+    """Test that frames taking longer than the critical frame time log an error."""
+    levels = []
+    for name in ("info", "warning", "error"):
+        monkeypatch.setattr(monitor.perf_logger, name, lambda msg, name=name: levels.append(name))
+    
+    times = iter([10.0, 10.05, 10.05])
+    monkeypatch.setattr("time.perf_counter", lambda: next(times))
+    monitor.start_frame()
+    monitor.end_frame()
+    monitor._log_performance_data()
+    
+    assert levels == ["error"]
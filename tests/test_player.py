@@ -0,0 +1,43 @@
+import pytest
+from src.entities.player import Player
+
+@pytest.fixture
+def player():
+    return Player(x=5, y=3, world_width=10, world_height=8)
+
+def test_player_has_no_instance_dict(player):
+    """Test that Player stores its fields in slots."""
+    assert not hasattr(player, "__dict__")
+    with pytest.raises(AttributeError):
+        player.speed = 2
+
+def test_coordinates_are_ints(player):
+    """Test that coordinates are stored as ints however they are given."""
+    player.move(1.0, -1.0)
+    assert (player.x, player.y) == (6, 2)
+    assert type(player.x) is int and type(player.y) is int
+
+    player.teleport(2.0, 7.0)
+    assert type(player.x) is int and type(player.y) is int
+
+def test_visited_positions(player):
+    """Test that moves and teleports mark positions as visited."""
+    assert not player.has_visited((5, 3))
+
+    player.move(1, 0)
+    player.teleport(0, 7)
+
+    assert player.has_visited((6, 3))
+    assert player.has_visited((0, 7))
+    assert player.visited[3, 6] and player.visited[7, 0]
+    assert not player.has_visited((20, 20))
+
+def test_player_equality(player):
+    """Test that players compare by position and appearance, not visited history."""
+    other = Player(x=5, y=3, world_width=player.world_width, world_height=player.world_height)
+    other.teleport(0, 0)
+    other.teleport(5, 3)
+    assert other == player
+
+    other.move(1, 0)
+    assert other != player
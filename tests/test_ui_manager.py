@@ -1,8 +1,12 @@
 import pytest
+import numpy as np
 import tcod
 from src.engine.display_manager import DisplayManager
 from src.engine.message_manager import MessageManager
 from src.engine.ui_manager import UIManager
+from src.entities.player import Player
+from src.world.biome_type import BiomeType
+from src.world.settlement_generator import Settlement, SettlementType
 
 @pytest.fixture
 def message_manager():
@@ -226,4 +230,191 @@ def test_ui_responsiveness(ui_manager):
     
     # Verify dimensions haven't changed
     assert main_console.width == original_width
-    assert main_console.height == original_height 
\ No newline at end of file
+    assert main_console.height == original_height 
+
+def test_message_log_frame_reused(ui_manager, message_manager):
+    """Test that the cached frame and title are redrawn and clear old messages."""
+    message_console = ui_manager.display_manager.get_console("message_log")
+    message_console.print(2, 3, "stale text")
+    
+    ui_manager._render_message_log()
+    
+    title = " Messages "
+    title_x = (message_console.width - len(title)) // 2
+    row = "".join(chr(c) for c in message_console.ch[0, title_x:title_x + len(title)])
+    assert row == title
+    assert message_console.ch[3, 2] == ord(" ")
+
+def test_unchanged_panels_not_redrawn(ui_manager, message_manager):
+    """Test that a panel is only redrawn once what it shows has changed."""
+    message_console = ui_manager.display_manager.get_console("message_log")
+    message_manager.add_message("First", fg=(255, 255, 255))
+    ui_manager.render_game_screen()
+    
+    message_console.print(2, 3, "X")
+    ui_manager.render_game_screen()
+    assert chr(message_console.ch[3, 2]) == "X"
+    
+    message_manager.add_message("Second", fg=(255, 255, 255))
+    ui_manager.render_game_screen()
+    assert message_console.ch[3, 2] == ord(" ")
+
+def test_terrain_colors_by_biome(ui_manager):
+    """Test that forests and mountains are recolored from the biome ID array."""
+    ch = np.array([[ord('♠'), ord('♠'), ord('^'), ord('^')]], dtype=np.uint32)
+    biome_info = np.array([[BiomeType.TUNDRA.value, BiomeType.GRASSLAND.value,
+                            BiomeType.TEMPERATE_FOREST.value, -1]], dtype=np.int8)
+    
+    fg = ui_manager._terrain_colors(ch, biome_info)
+    
+    assert fg[0].tolist() == [[200, 200, 200], [0, 180, 0], [139, 69, 19], [128, 128, 128]]
+
+def test_refresh_consoles(ui_manager):
+    """Test that console layers are cached and picked up again on refresh."""
+    display_manager = ui_manager.display_manager
+    assert ui_manager._console_main is display_manager.get_console("main")
+    
+    replacement = display_manager.consoles["main"] = tcod.console.Console(20, 10)
+    ui_manager.refresh_consoles()
+    ui_manager._render_main_view()
+    
+    assert ui_manager._console_main is replacement
+    assert chr(replacement.ch[0, 0]) == "┌"
+
+def test_status_bar_redrawn_only_when_text_changes(ui_manager):
+    """Test that moving within one biome leaves the status bar as drawn."""
+    biome_map = np.full((10, 10), BiomeType.GRASSLAND.value)
+    biome_map[:, 5:] = BiomeType.COLD_DESERT.value
+    ui_manager.set_world_data({'biome_map': biome_map, 'settlements': []})
+    ui_manager.set_player(Player(x=1, y=1, world_width=10, world_height=10))
+    status_console = ui_manager.display_manager.get_console("status")
+    
+    center = status_console.width // 2
+    ui_manager._render_status_bar()
+    status_console.print(center, 1, "X")
+    ui_manager.player.move(1, 0)
+    ui_manager._render_status_bar()
+    assert chr(status_console.ch[1, center]) == "X"
+    
+    ui_manager.player.teleport(7, 1)
+    ui_manager._render_status_bar()
+    row = "".join(chr(c) for c in status_console.ch[1])
+    assert "X" not in row
+    assert "Cold Desert" in row
+
+def test_status_bar_shows_settlement_under_player(ui_manager):
+    """Test that the settlement at the player's position is named in the status bar."""
+    ui_manager.set_world_data({
+        'biome_map': np.full((10, 10), BiomeType.GRASSLAND.value),
+        'settlements': [Settlement(SettlementType.TOWN, (3, 6), "Ashford"),
+                        Settlement(SettlementType.RUINS, (3, 6), "Hidden")],
+    })
+    ui_manager.set_player(Player(x=6, y=3, world_width=10, world_height=10))
+    ui_manager._render_status_bar()
+    
+    row = "".join(chr(c) for c in ui_manager.display_manager.get_console("status").ch[1])
+    assert "Grassland | Town: Unexplored" in row
+
+def test_minimap_redrawn_after_invalidate(ui_manager):
+    """Test that in-place world data changes show once the minimap cache is invalidated."""
+    minimap_console = ui_manager.display_manager.get_console("minimap")
+    shape = (minimap_console.height * 2, minimap_console.width * 2)
+    world_data = {
+        'heightmap': np.full(shape, 0.5),
+        'discovery_mask': np.zeros(shape, dtype=bool),
+    }
+    ui_manager.set_world_data(world_data)
+    ui_manager._render_minimap()
+    assert chr(minimap_console.ch[2, 2]) == "?"
+    
+    world_data['discovery_mask'][...] = True
+    ui_manager._render_minimap()
+    assert chr(minimap_console.ch[2, 2]) == "?"
+    
+    ui_manager.invalidate_minimap_cache()
+    ui_manager._render_minimap()
+    assert chr(minimap_console.ch[2, 2]) == "."
+
+def test_minimap_drawn_inside_cached_frame(ui_manager):
+    """Test that the minimap is framed and titled around the rendered map."""
+    minimap_console = ui_manager.display_manager.get_console("minimap")
+    shape = (minimap_console.height * 2, minimap_console.width * 2)
+    ui_manager.set_world_data({'heightmap': np.full(shape, 0.5)})
+    ui_manager._render_minimap()
+    
+    title = " World Map "
+    title_x = (minimap_console.width - len(title)) // 2
+    row = "".join(chr(c) for c in minimap_console.ch[0, title_x:title_x + len(title)])
+    assert row == title
+    assert chr(minimap_console.ch[-1, 0]) == "└"
+    assert chr(minimap_console.ch[-1, -1]) == "┘"
+    assert chr(minimap_console.ch[1, 1]) == "."
+
+def test_main_view_reuses_buffers(ui_manager):
+    """Test that the main view renders into the same buffers frame after frame."""
+    main_console = ui_manager.display_manager.get_console("main")
+    shape = (main_console.height * 2, main_console.width * 2)
+    ui_manager.set_world_data({'heightmap': np.full(shape, 0.5)})
+    ui_manager.set_player(Player(x=shape[1] // 2, y=shape[0] // 2, world_width=shape[1], world_height=shape[0]))
+    
+    ui_manager._render_main_view()
+    buffers = (ui_manager._main_ch, ui_manager._main_fg, ui_manager._main_hidden)
+    ui_manager.player.move(1, 0)
+    ui_manager._render_main_view()
+    
+    assert all(a is b for a, b in zip(buffers, (ui_manager._main_ch, ui_manager._main_fg, ui_manager._main_hidden)))
+    assert chr(main_console.ch[main_console.height // 2, main_console.width // 2]) == "@"
+
+def test_main_view_frame_while_generating(ui_manager):
+    """Test that the cached main view frame is shown while the world generates."""
+    main_console = ui_manager.display_manager.get_console("main")
+    main_console.print(3, 3, "stale")
+    
+    ui_manager._render_main_view()
+    
+    top = "".join(chr(c) for c in main_console.ch[0])
+    middle = "".join(chr(c) for c in main_console.ch[main_console.height // 2])
+    assert top.startswith("┌") and " World View " in top
+    assert "Generating world..." in middle
+    assert main_console.ch[3, 3] == ord(" ")
+
+def test_status_bar_restores_only_changed_spans(ui_manager):
+    """Test that a new status text repaints its own span and keeps the static labels."""
+    biome_map = np.full((10, 10), BiomeType.GRASSLAND.value)
+    biome_map[:, 5:] = BiomeType.TEMPERATE_RAINFOREST.value
+    ui_manager.set_world_data({'biome_map': biome_map, 'settlements': []})
+    ui_manager.set_player(Player(x=6, y=1, world_width=10, world_height=10))
+    status_console = ui_manager.display_manager.get_console("status")
+    
+    ui_manager._render_status_bar()
+    status_console.print(0, 0, "X")
+    ui_manager.player.teleport(1, 1)
+    ui_manager._render_status_bar()
+    
+    row = "".join(chr(c) for c in status_console.ch[1])
+    assert chr(status_console.ch[0, 0]) == "X"
+    assert "Rainforest" not in row
+    assert "Grassland" in row
+    assert "Status: Active" in row and "HP: 100/100" in row
+
+def test_status_bar_mouse_readout(ui_manager):
+    """Test that the mouse readout is drawn over the status text and survives its changes."""
+    biome_map = np.full((10, 10), BiomeType.GRASSLAND.value)
+    biome_map[:, 5:] = BiomeType.TEMPERATE_RAINFOREST.value
+    ui_manager.set_world_data({'biome_map': biome_map, 'settlements': []})
+    ui_manager.set_player(Player(x=1, y=1, world_width=10, world_height=10))
+    status_console = ui_manager.display_manager.get_console("status")
+    row = lambda: "".join(chr(c) for c in status_console.ch[1])
+    
+    ui_manager.set_mouse_tile((3, 4))
+    ui_manager._render_status_bar()
+    assert "Mouse: 3, 4" in row()
+    
+    # A new biome repaints the row and the readout with it
+    ui_manager.player.teleport(6, 1)
+    ui_manager._render_status_bar()
+    assert "Mouse: 3, 4" in row()
+    
+    ui_manager.set_mouse_tile((12, 40))
+    ui_manager._render_status_bar()
+    assert "Mouse: 12, 40" in row() and "Mouse: 3, 4" not in row()
@@ -155,4 +155,77 @@ def test_save_and_load_world(world_generator, tmp_path):
     # Compare original and loaded worlds
     # This will fail until save/load is implemented, as noted in TODOs
     with pytest.raises(NotImplementedError):
-        world_generator.save_world(world, str(save_path)) 
\ No newline at end of file
+        world_generator.save_world(world, str(save_path)) 
+
+def test_precipitation_without_water(world_generator):
+    """Test that precipitation stays finite on maps with no water or only water."""
+    biome_generator = world_generator.biome_generator
+    ocean_level = biome_generator.settings.ocean_level
+    for level in (ocean_level + 0.1, ocean_level - 0.1):
+        heightmap = np.full((32, 48), level)
+        heightmap[8:16, 8:16] += 0.05
+        precipitation = biome_generator.generate_precipitation_map(heightmap, seed=1)
+        assert np.isfinite(precipitation).all()
+        assert precipitation.min() >= 0 and precipitation.max() <= 1
+
+def _cascade_biomes(settings, heightmap, temperature, precipitation):
+    """Reference per-cell classification, as assign_biomes originally did it."""
+    from src.world.biome_type import BiomeType
+    biome_map = np.zeros(heightmap.shape, dtype=np.int32)
+    for (y, x), h in np.ndenumerate(heightmap):
+        t, p = temperature[y, x], precipitation[y, x]
+        if h < settings.ocean_level:
+            biome = BiomeType.OCEAN if h < settings.ocean_level - 0.1 else BiomeType.SHALLOW_OCEAN
+        elif h < settings.ocean_level + 0.05:
+            biome = BiomeType.BEACH
+        elif h > settings.mountain_level:
+            biome = BiomeType.SNOW_PEAKS if t < settings.cold_thresh else BiomeType.MOUNTAIN
+        elif t < settings.cold_thresh:
+            biome = BiomeType.COLD_DESERT if p < settings.dry_thresh else BiomeType.TUNDRA
+        elif t < settings.temperate_thresh:
+            if p < settings.dry_thresh:
+                biome = BiomeType.GRASSLAND
+            elif p < settings.wet_thresh:
+                biome = BiomeType.TEMPERATE_FOREST
+            else:
+                biome = BiomeType.TEMPERATE_RAINFOREST
+        elif p < settings.dry_thresh:
+            biome = BiomeType.DESERT
+        elif p < settings.wet_thresh:
+            biome = BiomeType.SAVANNA
+        else:
+            biome = BiomeType.TROPICAL_RAINFOREST
+        biome_map[y, x] = biome.value
+    return biome_map
+
+@pytest.mark.parametrize("overrides", [
+    {},
+    {"mountain_level": 0.38},
+    {"cold_thresh": 0.7, "temperate_thresh": 0.4},
+    {"dry_thresh": 0.8, "wet_thresh": 0.2},
+])
+def test_assign_biomes_matches_cascade(overrides):
+    """Test that assign_biomes agrees with the per-cell cascade, edges and NaN included."""
+    biomes = {
+        "ocean_level": 0.35, "mountain_level": 0.65,
+        "cold_thresh": 0.3, "temperate_thresh": 0.6,
+        "dry_thresh": 0.3, "wet_thresh": 0.6,
+    }
+    biomes.update(overrides)
+    settings = BiomeSettings.from_config({"world_gen": {"biomes": biomes}})
+    assert settings.mountain_level >= settings.ocean_level + 0.05
+    assert settings.temperate_thresh >= settings.cold_thresh
+    assert settings.wet_thresh >= settings.dry_thresh
+    
+    rng = np.random.default_rng(0)
+    shape = (60, 50)
+    heightmap, temperature, precipitation = (rng.random(shape) for _ in range(3))
+    # Values exactly on each threshold, and missing values
+    edges = [settings.ocean_level - 0.1, settings.ocean_level, settings.ocean_level + 0.05, settings.mountain_level]
+    heightmap[0, :len(edges)] = edges
+    temperature[1, :2] = settings.cold_thresh, settings.temperate_thresh
+    precipitation[2, :2] = settings.dry_thresh, settings.wet_thresh
+    heightmap[3, 0] = temperature[3, 1] = precipitation[3, 2] = np.nan
+    
+    biome_map = BiomeGenerator(settings).assign_biomes(heightmap, temperature, precipitation)
+    np.testing.assert_array_equal(biome_map, _cascade_biomes(settings, heightmap, temperature, precipitation))